@@ -2,20 +2,29 @@
 Changelog fetching, parsing, categorization, and docs-link resolution.
 """
 
+import hashlib
 import html
 import json
+import math
 import os
 import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
-from typing import Optional
+from itertools import chain, islice
+from typing import Iterator, Optional
 from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
 from zoneinfo import ZoneInfo
 
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 CHANGELOG_FEED_URL = "https://github.blog/changelog/feed/"
 DOCS_BASE_URL = "https://docs.github.com"
@@ -30,10 +39,39 @@ PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
 # Only include entries from the past 7 days
 MAX_AGE_DAYS = 7
 
+# BeautifulSoup tree builder for every parse in this module. lxml is C-backed
+# and several times faster than the pure-Python "html.parser".
+_HTML_PARSER = "lxml"
+
+# Concurrent docs lookups. Capped to stay polite to docs.github.com.
+DOCS_LOOKUP_WORKERS = 8
+
 # Shared session for docs-resolution calls. A single run makes many requests to
 # the same host (docs.github.com); reusing one connection (keep-alive) avoids a
-# fresh TCP+TLS handshake per call. Behavior is otherwise identical to requests.*.
+# fresh TCP+TLS handshake per call. The pool is sized for the concurrent lookups
+# in enrich_entries, and rate limiting / transient gateway errors get a couple of
+# quick retries (the final response is still returned, so raise_for_status
+# behaves as before). Retry-After is deliberately ignored: urllib3 sleeps for
+# whatever the server asks, uncapped, which could stall enrichment past the
+# job's 5-minute limit; a lookup that still fails just gets no docs link. Read
+# timeouts aren't retried either, so a slow page costs one timeout, not three.
 _DOCS_SESSION = requests.Session()
+_DOCS_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+})
+_DOCS_SESSION.mount("https://", HTTPAdapter(
+    pool_maxsize=2 * DOCS_LOOKUP_WORKERS,
+    max_retries=Retry(total=2, read=0, backoff_factor=0.3,
+                      status_forcelist=(429, 502, 503, 504), raise_on_status=False,
+                      respect_retry_after_header=False),
+))
+
+# (connect, read) timeouts for docs calls: fail fast on an unreachable host while
+# still giving a slow page time to render.
+_DOCS_TIMEOUT = (3, 10)
+
+# Accept header for docs page fetches (HTML pages, like a browser).
+_HTML_ACCEPT = 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
 
 # Human-verified docs-link overrides, keyed by changelog entry URL. Consulted
 # before any automated resolution so audited entries always link to the proven
@@ -43,6 +81,63 @@ _NO_OVERRIDE = object()  # sentinel: entry isn't in the override map -> resolve
 _overrides_cache = None
 
 
+# Conditional-GET cache for the changelog feed: the validators (ETag /
+# Last-Modified) from the last successful fetch, plus the raw body to re-parse
+# when the server answers 304 Not Modified. Purely an optimization — any
+# problem reading or writing it falls back to a plain full fetch.
+_FEED_CACHE_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "feed_cache.json")
+_FEED_BODY_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "feed_cache.xml")
+
+
+def _load_feed_cache() -> tuple[dict, Optional[bytes]]:
+    """Return (validators, cached body); ({}, None) when there's no usable cache."""
+    try:
+        with open(_FEED_CACHE_FILE) as f:
+            validators = json.load(f)
+        if not isinstance(validators, dict):
+            return {}, None
+        with open(_FEED_BODY_FILE, "rb") as f:
+            return validators, f.read()
+    except (OSError, json.JSONDecodeError):
+        return {}, None
+
+
+def _replace_file(path: str, data: bytes) -> None:
+    """Write data to path atomically (temp file + os.replace), so a run killed
+    mid-write leaves either the old file or the new one, never a partial one."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _save_feed_cache(response: requests.Response) -> None:
+    """Persist the response's validators and body for the next conditional GET.
+
+    The validators file is removed first and written last: if the run dies in
+    between, the next fetch finds no validators and does a plain full GET
+    rather than pairing old validators with a different body. A response with
+    no validators clears the cache, since the old ones no longer describe the
+    feed.
+    """
+    validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    try:
+        if os.path.exists(_FEED_CACHE_FILE):
+            os.remove(_FEED_CACHE_FILE)
+        if not any(validators.values()):
+            if os.path.exists(_FEED_BODY_FILE):
+                os.remove(_FEED_BODY_FILE)
+            return
+        os.makedirs(os.path.dirname(_FEED_CACHE_FILE), exist_ok=True)
+        _replace_file(_FEED_BODY_FILE, response.content)
+        _replace_file(_FEED_CACHE_FILE, json.dumps(validators).encode("utf-8"))
+    except OSError as e:
+        print(f"  ⚠️  Could not write feed cache: {e}")
+
+
 def docs_override(entry_url: str):
     """Return the verified docs URL for an entry (a str), None to suppress the
     link, or the _NO_OVERRIDE sentinel when the entry isn't listed."""
@@ -58,21 +153,30 @@ def docs_override(entry_url: str):
     return _NO_OVERRIDE
 
 
+def _format_pst(dt: datetime) -> str:
+    """Format an aware datetime as a Pacific Time date, e.g. "Jan 15, 2026"."""
+    # Day and year from attributes rather than strftime's "%-d", which is
+    # glibc-only (it raises on Windows).
+    local = dt.astimezone(PACIFIC_TZ)
+    return f"{local:%b} {local.day}, {local.year}"
+
+
 def convert_to_pst(date_string: str) -> str:
     """Convert RSS date string to Pacific Time formatted string."""
     try:
         # Parse the RSS date format (e.g., "Thu, 15 Jan 2026 21:57:44 +0000")
-        dt = parsedate_to_datetime(date_string)
-        # Convert to Pacific Time
-        dt_pst = dt.astimezone(PACIFIC_TZ)
-        # Format nicely: "Jan 15, 2026"
-        return dt_pst.strftime("%b %-d, %Y")
+        return _format_pst(parsedate_to_datetime(date_string))
     except Exception:
         # If parsing fails, return original
         return date_string
 
 
-@dataclass
+# Entries are slotted (no per-instance __dict__) where the runtime supports it:
+# dataclass(slots=True) needs Python 3.10, and 3.9 is still supported.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ChangelogEntry:
     """Represents a single changelog entry."""
     title: str
@@ -89,6 +193,7 @@ class ChangelogEntry:
     key_features: list = field(default_factory=list)
 
 
+@lru_cache(maxsize=256)
 def _capitalize_label(label: str) -> str:
     """Capitalize each word of a feed label for display ("collaboration tools"
     -> "Collaboration Tools"), preserving existing uppercase ("API" stays "API").
@@ -96,6 +201,9 @@ def _capitalize_label(label: str) -> str:
     Labels come straight from the feed's changelog-label term, which can carry a
     raw HTML entity (e.g. "ecosystem &amp; accessibility"); unescape it first so
     it doesn't get double-escaped by the template into a literal "&amp;".
+
+    Memoized: the feed reuses a small vocabulary of labels, so every entry
+    carrying the same label shares one string instead of its own copy.
     """
     label = html.unescape(label)
     return " ".join(w[:1].upper() + w[1:] for w in label.split(" "))
@@ -112,10 +220,27 @@ def fetch_changelog(max_age_days: int = MAX_AGE_DAYS) -> list[ChangelogEntry]:
     "nothing new today" and let the daily run pass silently green. Fetching the
     bytes ourselves with a timeout + raise_for_status turns an outage into a loud
     failure, while a genuinely empty (but reachable) feed still returns [].
+
+    The fetch is a conditional GET: when the feed hasn't changed since the last
+    run (304 Not Modified), the cached body is re-parsed instead of downloaded.
+    Entries are always rebuilt from the body so the age cutoff stays current.
     """
-    response = requests.get(CHANGELOG_FEED_URL, timeout=10)
-    response.raise_for_status()
-    feed = feedparser.parse(response.content)
+    validators, cached_body = _load_feed_cache()
+    headers = {}
+    if cached_body is not None:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = requests.get(CHANGELOG_FEED_URL, headers=headers, timeout=10)
+    if response.status_code == 304 and cached_body is not None:
+        body = cached_body
+    else:
+        response.raise_for_status()
+        body = response.content
+        _save_feed_cache(response)
+    feed = feedparser.parse(body)
     if feed.bozo and not feed.entries:
         # Reachable but unparseable and nothing recovered — fail rather than
         # silently treating a broken feed as an empty one.
@@ -128,8 +253,12 @@ def fetch_changelog(max_age_days: int = MAX_AGE_DAYS) -> list[ChangelogEntry]:
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=max_age_days)
 
     for item in feed.entries:
+        # FeedParserDict attribute access goes through a key-mapping fallback;
+        # bind .get once and read every field as a plain key lookup.
+        item_get = item.get
+
         # Parse the publication date
-        published_str = item.get("published", "")
+        published_str = item_get("published", "")
         try:
             published_dt = parsedate_to_datetime(published_str)
         except Exception:
@@ -152,27 +281,27 @@ def fetch_changelog(max_age_days: int = MAX_AGE_DAYS) -> list[ChangelogEntry]:
         category = "Improvement"  # Default
         labels = []
 
-        for tag in item.get("tags", []):
-            if tag.get("scheme") == "changelog-type":
+        for tag in item_get("tags") or ():
+            scheme = tag.get("scheme")
+            if scheme == "changelog-type":
                 category = tag.get("term", "Improvement")
-            elif tag.get("scheme") == "changelog-label":
+            elif scheme == "changelog-label":
                 label = tag.get("term", "")
                 if label:
                     labels.append(_capitalize_label(label))
 
         # Get content (prefer full content over summary)
-        content_html = ""
-        if hasattr(item, "content") and item.content:
-            content_html = item.content[0].get("value", "")
-        elif hasattr(item, "summary"):
-            content_html = item.summary
+        summary = item_get("summary", "")
+        content = item_get("content")
+        content_html = content[0].get("value", "") if content else summary
 
         entry = ChangelogEntry(
-            title=item.get("title", ""),
-            url=item.get("link", ""),
-            published=convert_to_pst(published_str),
+            title=item_get("title", ""),
+            url=item_get("link", ""),
+            # Reuse the datetime parsed above rather than re-parsing the string.
+            published=_format_pst(published_dt),
             published_dt=published_dt,
-            summary=item.get("summary", ""),
+            summary=summary,
             content_html=content_html,
             category=category,
             labels=labels,
@@ -182,6 +311,17 @@ def fetch_changelog(max_age_days: int = MAX_AGE_DAYS) -> list[ChangelogEntry]:
     return entries
 
 
+# Normalized changelog-type term -> digest section.
+_CATEGORY_SECTIONS = {
+    "release": "releases",
+    "retired": "retirements",
+    "deprecated": "retirements",
+    "retirement": "retirements",
+    "improvement": "improvements",
+    "": "improvements",
+}
+
+
 def categorize_entries(entries: list[ChangelogEntry]) -> dict[str, list[ChangelogEntry]]:
     """Categorize entries into releases, improvements, and retirements."""
     categorized = {
@@ -189,24 +329,25 @@ def categorize_entries(entries: list[ChangelogEntry]) -> dict[str, list[Changelo
         "improvements": [],
         "retirements": [],
     }
+    # Bind each normalized term straight to its target list: one dict lookup
+    # per entry instead of an if/elif chain.
+    targets = {kind: categorized[section] for kind, section in _CATEGORY_SECTIONS.items()}
+    improvements = categorized["improvements"]
 
     for entry in entries:
         # Match case-insensitively: the term comes verbatim from the feed's
         # changelog-type tag, so a casing/wording change ("release", "Deprecated")
         # would otherwise silently land in Improvements.
         kind = (entry.category or "").strip().lower()
-        if kind == "release":
-            categorized["releases"].append(entry)
-        elif kind in ("retired", "deprecated", "retirement"):
-            categorized["retirements"].append(entry)
-        else:
-            if kind not in ("improvement", ""):
-                # Surface an unrecognized changelog-type so a feed-schema change
-                # is visible in CI logs rather than silently misclassified
-                # (consistent with the docs-coverage logging in main.py).
-                print(f"   ⚠️  Unrecognized changelog-type '{entry.category}' "
-                      f"— treating as Improvement: {entry.title[:60]}")
-            categorized["improvements"].append(entry)
+        target = targets.get(kind)
+        if target is None:
+            # Surface an unrecognized changelog-type so a feed-schema change
+            # is visible in CI logs rather than silently misclassified
+            # (consistent with the docs-coverage logging in main.py).
+            print(f"   ⚠️  Unrecognized changelog-type '{entry.category}' "
+                  f"— treating as Improvement: {entry.title[:60]}")
+            target = improvements
+        target.append(entry)
 
     return categorized
 
@@ -255,19 +396,126 @@ def convert_to_enterprise_docs_urls(url: str) -> list[str]:
     return candidates
 
 
-def verify_enterprise_url_exists(url: str) -> bool:
-    """Check that an enterprise docs URL actually exists (returns 200)."""
+def _docs_url_exists(url: str) -> bool:
+    """Check that a docs URL (Enterprise or general) actually exists (returns 200)."""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept': 'text/html',
-        }
-        response = _DOCS_SESSION.head(url, headers=headers, timeout=10, allow_redirects=True)
+        response = _DOCS_SESSION.head(url, headers={'Accept': 'text/html'}, timeout=_DOCS_TIMEOUT, allow_redirects=True)
         return response.status_code == 200
     except Exception:
         return False
 
 
+# Original name, kept for existing callers.
+verify_enterprise_url_exists = _docs_url_exists
+
+
+# Common words that don't help a docs search; stripped from the query.
+_SEARCH_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'shall',
+    'can', 'need', 'dare', 'ought', 'used', 'to', 'of', 'in',
+    'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into',
+    'through', 'during', 'before', 'after', 'above', 'below',
+    'between', 'under', 'again', 'further', 'then', 'once',
+    'now', 'generally', 'available', 'new', 'and', 'or', 'but',
+    'if', 'because', 'until', 'while', 'this', 'that', 'these',
+    'those', 'am', 'it', 'its', "it's", 'they', 'them', 'their',
+    'what', 'which', 'who', 'whom', 'where', 'when', 'why', 'how',
+    'all', 'each', 'every', 'both', 'few', 'more', 'most', 'other',
+    'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same',
+    'so', 'than', 'too', 'very', 'just', 'also',
+})
+_SEARCH_WORD_RE = re.compile(r'\b[a-zA-Z][a-zA-Z0-9+#-]*\b')
+# ASCII fast path for the tokenizer: every ASCII char that can't be part of a
+# search token becomes a space, so tokenizing is one C-level translate + split.
+_SEARCH_TOKEN_TABLE = str.maketrans({
+    chr(c): " " for c in range(128) if not (chr(c).isalnum() or chr(c) in "+#-")
+})
+_LINK_STRAINER = SoupStrainer("a", href=True)
+# Non-article links on the search page (navigation, policy, onboarding).
+_SEARCH_SKIP_PATHS = ("/search", "/site-policy", "/get-started/learning-about-github")
+
+
+def _search_tokens(text: str) -> list[str]:
+    """Lowercased candidate search words (letter-led; may contain + # -).
+
+    ASCII text — nearly every title — takes the str.translate fast path, which
+    is ~2x quicker than the regex; anything else falls back to _SEARCH_WORD_RE.
+    """
+    text = text.lower()
+    if not text.isascii():
+        return _SEARCH_WORD_RE.findall(text)
+    words = []
+    for word in text.translate(_SEARCH_TOKEN_TABLE).split():
+        word = word.strip("+#-")
+        if word and word[0].isalpha():
+            words.append(word)
+    return words
+
+
+# Search-result and page fetches are memoized for the run: entries on the same
+# topic (several Copilot posts, say) search the same capped keyword query and
+# validate the same candidate pages, so each distinct URL is fetched once.
+# Failed fetches raise and are therefore never cached.
+@lru_cache(maxsize=256)
+def _search_docs_page(search_query: str, prefer_enterprise: bool) -> Optional[str]:
+    """Fetch one docs search page and pick its best result link (see search_github_docs)."""
+    # Search enterprise docs (default) or the general docs.
+    if prefer_enterprise:
+        search_url = f"https://docs.github.com/en/enterprise-cloud@latest/search?query={requests.utils.quote(search_query)}"
+    else:
+        search_url = f"https://docs.github.com/en/search?query={requests.utils.quote(search_query)}"
+
+    response = _DOCS_SESSION.get(search_url, headers={'Accept': _HTML_ACCEPT}, timeout=_DOCS_TIMEOUT)
+    response.raise_for_status()
+
+    # Only the result links matter, so build just the <a href> nodes rather
+    # than the whole (large) search page tree.
+    soup = BeautifulSoup(response.text, _HTML_PARSER, parse_only=_LINK_STRAINER)
+
+    # Look for search result links. Prefer a non-REST page — REST API
+    # reference pages match keywords but document the API, not the feature;
+    # keep the first REST hit only as a last resort.
+    rest_fallback = None
+    for link in soup.find_all("a", href=True):
+        href = link["href"]
+        if not (href.startswith("/en/") and not any(x in href for x in _SEARCH_SKIP_PATHS)):
+            continue
+        full_url = f"https://docs.github.com{href}"
+        if prefer_enterprise and not is_enterprise_docs_url(full_url):
+            continue
+        if "/rest/" in href or "apiversion=" in href:
+            rest_fallback = rest_fallback or full_url
+            continue
+        return full_url
+
+    return rest_fallback
+
+
+# Read at most this much of a docs page for validation. Real articles are well
+# under it (the <title> and article text come early); the cap only bounds the
+# time and memory an unexpectedly huge or runaway response can cost.
+_MAX_DOCS_PAGE_BYTES = 1_000_000
+
+
+@lru_cache(maxsize=256)
+def _fetch_docs_page(url: str) -> tuple[str, str]:
+    """Fetch a docs page and return its (body text, <title>), both lowercased."""
+    response = _DOCS_SESSION.get(url, headers={'Accept': _HTML_ACCEPT}, timeout=_DOCS_TIMEOUT,
+                                 allow_redirects=True, stream=True)
+    try:
+        response.raise_for_status()
+        markup = response.raw.read(_MAX_DOCS_PAGE_BYTES, decode_content=True)
+    finally:
+        response.close()
+
+    soup = BeautifulSoup(markup, _HTML_PARSER)
+    page_text = soup.get_text(separator=" ", strip=True).lower()
+    page_title = (soup.title.get_text().lower() if soup.title else "")
+    return page_text, page_title
+
+
 def search_github_docs(query: str, prefer_enterprise: bool = True) -> Optional[str]:
     """
     Search GitHub documentation for the most relevant page.
@@ -278,74 +526,85 @@ def search_github_docs(query: str, prefer_enterprise: bool = True) -> Optional[s
     ``query`` may include the entry summary for richer context.
     """
     try:
-        # Clean up the query - extract key terms
-        # Remove common words that don't help search
-        stop_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 
-                      'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-                      'would', 'could', 'should', 'may', 'might', 'must', 'shall',
-                      'can', 'need', 'dare', 'ought', 'used', 'to', 'of', 'in',
-                      'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into',
-                      'through', 'during', 'before', 'after', 'above', 'below',
-                      'between', 'under', 'again', 'further', 'then', 'once',
-                      'now', 'generally', 'available', 'new', 'and', 'or', 'but',
-                      'if', 'because', 'until', 'while', 'this', 'that', 'these',
-                      'those', 'am', 'it', 'its', "it's", 'they', 'them', 'their',
-                      'what', 'which', 'who', 'whom', 'where', 'when', 'why', 'how',
-                      'all', 'each', 'every', 'both', 'few', 'more', 'most', 'other',
-                      'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same',
-                      'so', 'than', 'too', 'very', 'just', 'also'}
-        
-        # Extract meaningful words from query
-        words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9+#-]*\b', query.lower())
-        keywords = [w for w in words if w not in stop_words and len(w) > 2]
-        
+        # Extract meaningful words from query, keeping the top 6 keywords
+        words = _search_tokens(query)
+        keywords = list(islice(
+            (w for w in words if w not in _SEARCH_STOP_WORDS and len(w) > 2), 6
+        ))
+
         if not keywords:
             return None
-        
-        # Build search query
-        search_query = " ".join(keywords[:6])  # Limit to top 6 keywords
-        
-        # Search enterprise docs (default) or the general docs.
-        if prefer_enterprise:
-            search_url = f"https://docs.github.com/en/enterprise-cloud@latest/search?query={requests.utils.quote(search_query)}"
-        else:
-            search_url = f"https://docs.github.com/en/search?query={requests.utils.quote(search_query)}"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        }
-        
-        response = _DOCS_SESSION.get(search_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # Look for search result links. Prefer a non-REST page — REST API
-        # reference pages match keywords but document the API, not the feature;
-        # keep the first REST hit only as a last resort.
-        rest_fallback = None
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            skip = ["/search", "/site-policy", "/get-started/learning-about-github"]
-            if not (href.startswith("/en/") and not any(x in href for x in skip)):
-                continue
-            full_url = f"https://docs.github.com{href}"
-            if prefer_enterprise and not is_enterprise_docs_url(full_url):
-                continue
-            if "/rest/" in href or "apiversion=" in href:
-                rest_fallback = rest_fallback or full_url
-                continue
-            return full_url
-
-        return rest_fallback
-        
+
+        return _search_docs_page(" ".join(keywords), prefer_enterprise)
+
     except Exception as e:
         print(f"  ⚠️  Docs search failed for '{query[:50]}...': {e}")
         return None
 
 
-def validate_docs_url(url: str, title: str, summary: str = "", strict: bool = False) -> bool:
+# Word tokenizer for relevance keywords (also keeps dotted tokens like "3.21").
+_KEYWORD_RE = re.compile(r'\b[a-zA-Z][a-zA-Z0-9+#.-]*\b')
+
+
+# Words too generic to signal that a docs page matches an entry title.
+_VALIDATION_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'shall',
+    'can', 'need', 'to', 'of', 'in', 'for', 'on', 'with', 'at',
+    'by', 'from', 'as', 'into', 'through', 'during', 'before',
+    'after', 'now', 'generally', 'available', 'new', 'and', 'or',
+    'but', 'if', 'this', 'that', 'these', 'those', 'it', 'its',
+    'all', 'each', 'every', 'both', 'few', 'more', 'most', 'other',
+    'some', 'such', 'no', 'not', 'only', 'own', 'same', 'so',
+    'than', 'too', 'very', 'just', 'also', 'github', 'support',
+    'supports', 'update', 'updates', 'feature', 'features',
+    'track', 'additional', 'changes', 'preview', 'technical',
+})
+
+
+def _validation_keywords(title: str) -> list[str]:
+    """Lowercased title keywords that validate_docs_url looks for on the page."""
+    return [w for w in _KEYWORD_RE.findall(title.lower())
+            if w not in _VALIDATION_STOP_WORDS and len(w) > 2]
+
+
+# Share of a title's distinct keywords that an embedded link's path must spell
+# out to skip the page fetch — the same bar validate_docs_url sets for the body.
+_PATH_MATCH_RATIO = 0.3
+
+
+def _path_names_title(url: str, keywords: list[str]) -> bool:
+    """True when a docs URL's path itself spells out the title's keywords.
+
+    Needs at least 30% of the distinct keywords (and never fewer than two), so
+    generic product words alone ("actions", "runner") don't qualify. For a link
+    GitHub embedded in its own post (e.g. ".../copilot/.../code-review" for
+    "Copilot code review ..."), that is strong evidence of relevance.
+    """
+    distinct = set(keywords)
+    path = urlsplit(url).path.lower()
+    needed = max(2, math.ceil(_PATH_MATCH_RATIO * len(distinct)))
+    return sum(1 for kw in distinct if kw in path) >= needed
+
+
+def _accept_by_path(url: str, keywords: list[str], exists: bool = False) -> bool:
+    """Accept an embedded docs link on its path alone, skipping the page fetch.
+
+    The link must still resolve: a cheap HEAD check runs unless the caller has
+    already made one (``exists=True``). Acceptances are logged distinctly so
+    the skipped-validation rate shows up in the run log.
+    """
+    if not _path_names_title(url, keywords):
+        return False
+    if not exists and not _docs_url_exists(url):
+        return False
+    print(f"  ✅ Accepted by path (not fetched): {url}")
+    return True
+
+
+def validate_docs_url(url: str, title: str, summary: str = "", strict: bool = False,
+                      keywords: Optional[list[str]] = None) -> bool:
     """
     Validate that a documentation URL is actually relevant to the changelog entry.
     Fetches the page and checks if its content meaningfully relates to the entry.
@@ -356,50 +615,19 @@ def validate_docs_url(url: str, title: str, summary: str = "", strict: bool = Fa
         summary: The changelog entry summary text.
         strict: If True, requires a higher match threshold (used for search results
                 which are less trustworthy than embedded links).
+        keywords: Precomputed _validation_keywords(title), so a caller checking
+                several candidates for one entry tokenizes the title once.
     
     Returns True only if the page content matches the entry topic.
     """
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        }
-        response = _DOCS_SESSION.get(url, headers=headers, timeout=10, allow_redirects=True)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        page_text = soup.get_text(separator=" ", strip=True).lower()
-        page_title = (soup.title.get_text().lower() if soup.title else "")
-
-        # Extract meaningful keywords from the changelog entry title
-        stop_words = {
-            'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-            'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-            'would', 'could', 'should', 'may', 'might', 'must', 'shall',
-            'can', 'need', 'to', 'of', 'in', 'for', 'on', 'with', 'at',
-            'by', 'from', 'as', 'into', 'through', 'during', 'before',
-            'after', 'now', 'generally', 'available', 'new', 'and', 'or',
-            'but', 'if', 'this', 'that', 'these', 'those', 'it', 'its',
-            'all', 'each', 'every', 'both', 'few', 'more', 'most', 'other',
-            'some', 'such', 'no', 'not', 'only', 'own', 'same', 'so',
-            'than', 'too', 'very', 'just', 'also', 'github', 'support',
-            'supports', 'update', 'updates', 'feature', 'features',
-            'track', 'additional', 'changes', 'are', 'preview', 'technical',
-        }
-
-        title_words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9+#.-]*\b', title.lower())
-        keywords = [w for w in title_words if w not in stop_words and len(w) > 2]
-
-        if not keywords:
-            return False
-
-        # Check how many keywords from the entry title appear in the page content
-        matches = sum(1 for kw in keywords if kw in page_text)
-        match_ratio = matches / len(keywords) if keywords else 0
+    if keywords is None:
+        keywords = _validation_keywords(title)
+    if not keywords:
+        # Nothing to match on — don't spend a fetch to reject the page.
+        return False
 
-        # Also check page title for keyword overlap
-        title_matches = sum(1 for kw in keywords if kw in page_title)
-        title_ratio = title_matches / len(keywords) if keywords else 0
+    try:
+        page_text, page_title = _fetch_docs_page(url)
 
         # Thresholds depend on source trustworthiness:
         # - Embedded links (strict=False): 30% body OR 20% page title.
@@ -415,9 +643,24 @@ def validate_docs_url(url: str, title: str, summary: str = "", strict: bool = Fa
             body_threshold = 0.30
             title_threshold = 0.20
 
-        if match_ratio >= body_threshold or title_ratio >= title_threshold:
+        # Check the (short) page title first: when it already matches, the
+        # page body — often 100KB+ of text — never has to be scanned.
+        title_matches = sum(1 for kw in keywords if kw in page_title)
+        if title_matches / len(keywords) >= title_threshold:
             return True
 
+        # Otherwise check how many keywords from the entry title appear in the
+        # page content, stopping as soon as the verdict is settled either way.
+        n = len(keywords)
+        matches = 0
+        for i, kw in enumerate(keywords, 1):
+            if kw in page_text:
+                matches += 1
+                if matches / n >= body_threshold:
+                    return True
+            elif (matches + n - i) / n < body_threshold:
+                break  # even matching every remaining keyword can't reach it
+
         return False
 
     except Exception as e:
@@ -438,11 +681,16 @@ def search_docs_for_release(title: str, content_html: str = "", summary: str = "
       2. Search the docs using the title AND summary — Enterprise docs first,
          then general docs — each strictly validated for relevance.
 
-    Every candidate is fetched and checked against the entry's keywords before
-    it's used. Returns None if nothing validates, so the template shows no docs
-    link rather than a wrong one.
+    Every candidate is checked against the entry's keywords before it's used —
+    by fetching the page, unless it's an embedded link whose URL path already
+    names the topic (that link still gets a HEAD check). Returns None if
+    nothing validates, so the template shows no docs link rather than a wrong
+    one.
     """
+    # Tokenize once per entry: ranking uses title+summary keywords, page
+    # validation (run for up to five candidates) uses the title's.
     keywords = _relevance_keywords(f"{title} {summary}")
+    title_keywords = _validation_keywords(title)
 
     # 0) When the LLM features are enabled, let the model choose the canonical
     #    docs page — far more accurate than keyword overlap for cases where the
@@ -457,10 +705,10 @@ def search_docs_for_release(title: str, content_html: str = "", summary: str = "
             pick = _strip_tracking(pick)
             if not is_enterprise_docs_url(pick):
                 for candidate in convert_to_enterprise_docs_urls(pick):
-                    if verify_enterprise_url_exists(candidate):
+                    if _docs_url_exists(candidate):
                         print(f"  ✅ LLM-selected (enterprise): {candidate}")
                         return candidate
-            if verify_enterprise_url_exists(pick):
+            if _docs_url_exists(pick):
                 print(f"  ✅ LLM-selected: {pick}")
                 return pick
             print(f"  ⚠️  LLM-selected URL did not resolve, falling back: {pick}")
@@ -470,18 +718,25 @@ def search_docs_for_release(title: str, content_html: str = "", summary: str = "
     if embedded_url:
         embedded_url = _strip_tracking(embedded_url)
         # 1a. Already an Enterprise docs URL.
+        # An embedded link whose path already names the topic (and that still
+        # resolves) skips the page fetch; anything less certain is fetched and
+        # checked.
         if is_enterprise_docs_url(embedded_url):
-            if validate_docs_url(embedded_url, title, summary, strict=False):
+            if (_accept_by_path(embedded_url, title_keywords)
+                    or validate_docs_url(embedded_url, title, summary, strict=False, keywords=title_keywords)):
                 return embedded_url
             print(f"  ⚠️  Embedded enterprise docs URL rejected (not relevant): {embedded_url}")
         else:
             # 1b. Prefer a verified Enterprise version of the same page.
             for candidate in convert_to_enterprise_docs_urls(embedded_url):
-                if verify_enterprise_url_exists(candidate) and validate_docs_url(candidate, title, summary, strict=False):
+                if (_docs_url_exists(candidate)
+                        and (_accept_by_path(candidate, title_keywords, exists=True)
+                             or validate_docs_url(candidate, title, summary, strict=False, keywords=title_keywords))):
                     print(f"  ✅ Using enterprise equivalent: {candidate}")
                     return candidate
             # 1c. Otherwise use the accurate general docs link itself.
-            if validate_docs_url(embedded_url, title, summary, strict=False):
+            if (_accept_by_path(embedded_url, title_keywords)
+                    or validate_docs_url(embedded_url, title, summary, strict=False, keywords=title_keywords)):
                 print(f"  ✅ Using changelog docs link: {embedded_url}")
                 return embedded_url
             print(f"  ⚠️  Embedded docs URL rejected (not relevant): {embedded_url}")
@@ -489,10 +744,10 @@ def search_docs_for_release(title: str, content_html: str = "", summary: str = "
     # 2) Search the docs with full context (title + summary).
     query = f"{title} {summary}".strip()
     enterprise_hit = search_github_docs(query, prefer_enterprise=True)
-    if enterprise_hit and validate_docs_url(enterprise_hit, title, summary, strict=True):
+    if enterprise_hit and validate_docs_url(enterprise_hit, title, summary, strict=True, keywords=title_keywords):
         return enterprise_hit
     general_hit = search_github_docs(query, prefer_enterprise=False)
-    if general_hit and validate_docs_url(general_hit, title, summary, strict=True):
+    if general_hit and validate_docs_url(general_hit, title, summary, strict=True, keywords=title_keywords):
         return general_hit
 
     # Nothing verified — the template omits the docs link entirely.
@@ -516,21 +771,48 @@ def _strip_tracking(url: str) -> str:
         return url
 
 
+# Words too generic to rank one embedded docs link over another.
+_RELEVANCE_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'shall', 'can', 'to', 'of', 'in',
+    'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'now',
+    'generally', 'available', 'new', 'and', 'or', 'but', 'if', 'this',
+    'that', 'these', 'those', 'it', 'its', 'all', 'each', 'every', 'both',
+    'more', 'most', 'other', 'some', 'such', 'no', 'not', 'only', 'own',
+    'same', 'so', 'than', 'too', 'very', 'just', 'also', 'github', 'update',
+    'updates', 'feature', 'features', 'support', 'supports', 'preview',
+})
+
+
 def _relevance_keywords(text: str) -> list[str]:
     """Meaningful keywords from text, for relevance scoring and docs search."""
-    stop = {
-        'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-        'should', 'may', 'might', 'must', 'shall', 'can', 'to', 'of', 'in',
-        'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into', 'now',
-        'generally', 'available', 'new', 'and', 'or', 'but', 'if', 'this',
-        'that', 'these', 'those', 'it', 'its', 'all', 'each', 'every', 'both',
-        'more', 'most', 'other', 'some', 'such', 'no', 'not', 'only', 'own',
-        'same', 'so', 'than', 'too', 'very', 'just', 'also', 'github', 'update',
-        'updates', 'feature', 'features', 'support', 'supports', 'preview',
-    }
-    words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9+#.-]*\b', text.lower())
-    return [w for w in words if w not in stop and len(w) > 2]
+    words = _KEYWORD_RE.findall(text.lower())
+    return [w for w in words if w not in _RELEVANCE_STOP_WORDS and len(w) > 2]
+
+
+@lru_cache(maxsize=256)
+def _parse_html(content_html: str) -> BeautifulSoup:
+    """Parse changelog HTML once per run and share the tree across extractors.
+
+    The same content_html is read by the summary, key-feature, and docs-link
+    helpers; caching on the string means it's tokenized once, not per helper.
+    Callers must treat the returned soup as read-only.
+    """
+    return BeautifulSoup(content_html, _HTML_PARSER)
+
+
+@lru_cache(maxsize=256)
+def _docs_hrefs(content_html: str) -> tuple[str, ...]:
+    """The docs.github.com hrefs embedded in changelog HTML, in document order.
+
+    Both the heuristic ranking and the LLM candidate list read these links, so
+    the anchors are walked once per entry rather than once per consumer.
+    """
+    return tuple(
+        href for href in (a["href"] for a in _parse_html(content_html).find_all("a", href=True))
+        if href and not href.startswith("#") and "docs.github.com" in href
+    )
 
 
 def extract_best_docs_url(content_html: str, keywords: list[str]) -> Optional[str]:
@@ -542,16 +824,12 @@ def extract_best_docs_url(content_html: str, keywords: list[str]) -> Optional[st
     """
     if not content_html:
         return None
-    soup = BeautifulSoup(content_html, "html.parser")
     # Distinct keywords only — counting duplicates lets a word repeated in the
     # summary multiply a URL's score and drown out the ranking signals below.
     unique_keywords = set(keywords)
     best = None
     best_score = -1.0
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-        if not href or href.startswith("#") or "docs.github.com" not in href:
-            continue
+    for href in _docs_hrefs(content_html):
         path = href.lower()
         score = float(sum(1 for kw in unique_keywords if kw in path))
         if is_enterprise_docs_url(href):
@@ -572,57 +850,90 @@ def extract_best_docs_url(content_html: str, keywords: list[str]) -> Optional[st
     return best
 
 
-def _clean_html_to_text(html: str) -> str:
+# Blog-footer boilerplate stripped from every cleaned changelog body, fused into
+# one alternation so the text is scanned once. The trailing "Learn more" stays a
+# separate pass: it is often only exposed once the footer after it is removed.
+_BOILERPLATE_RE = re.compile(
+    r"(?:The post .+ )?appeared first on (?:The )?GitHub Blog\.", re.IGNORECASE
+)
+_TRAILING_LEARN_MORE_RE = re.compile(r"Learn more\s*$", re.IGNORECASE)
+
+# Text-cleanup patterns shared by the summary and feature normalizers.
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([,;:.!?])')
+_DOT_ELLIPSIS_RE = re.compile(r'\.…')
+_ELLIPSIS_DOT_RE = re.compile(r'…\.')
+_MULTI_DOT_RE = re.compile(r'\.\.+')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+# Elements whose text never belongs in a summary (code, layout, headings).
+_NON_PROSE_TAGS = frozenset({"script", "style", "table", "h1", "h2", "h3", "h4", "h5", "h6"})
+
+
+def _prose_text(soup: BeautifulSoup) -> str:
+    """soup.get_text(" ", strip=True) minus any text inside _NON_PROSE_TAGS.
+
+    Skips those subtrees instead of decompose()-ing them, so a soup shared via
+    _parse_html is never mutated.
+    """
+    parts = []
+    for node in soup.strings:
+        text = node.strip()
+        if text and not any(p.name in _NON_PROSE_TAGS for p in node.parents):
+            parts.append(text)
+    return " ".join(parts)
+
+
+def _clean_html_to_text(markup: str) -> str:
     """Strip HTML to clean text, removing boilerplate and normalizing whitespace."""
-    soup = BeautifulSoup(html, "html.parser")
-    for element in soup(["script", "style", "table", "h1", "h2", "h3", "h4", "h5", "h6"]):
-        element.decompose()
-    text = soup.get_text(separator=" ", strip=True)
-
-    boilerplate_patterns = [
-        r"The post .+ appeared first on The GitHub Blog\.",
-        r"The post .+ appeared first on GitHub Blog\.",
-        r"appeared first on The GitHub Blog\.",
-        r"appeared first on GitHub Blog\.",
-        r"Learn more\s*$",
-    ]
-    for pattern in boilerplate_patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE).strip()
+    if "<" in markup:
+        text = _prose_text(_parse_html(markup))
+    else:
+        # No tags (common for short RSS summaries): unescaping entities is all a
+        # parse would do, so skip building a tree.
+        text = html.unescape(markup)
+
+    text = _BOILERPLATE_RE.sub("", text).strip()
+    text = _TRAILING_LEARN_MORE_RE.sub("", text).strip()
 
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
     # Fix spaces before punctuation (artifact of stripping inline links/tags)
-    text = re.sub(r'\s+([,;:.!?])', r'\1', text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
     # Fix double punctuation like .… or ..
-    text = re.sub(r'\.…', '.', text)
-    text = re.sub(r'\.\.+', '.', text)
-    text = re.sub(r'…\.', '.', text)
+    text = _DOT_ELLIPSIS_RE.sub('.', text)
+    text = _MULTI_DOT_RE.sub('.', text)
+    text = _ELLIPSIS_DOT_RE.sub('.', text)
     return text
 
 
-# Filler/preamble patterns that don't add value in a summary
-_FILLER_PATTERNS = [
-    re.compile(p, re.IGNORECASE) for p in [
-        r"^(we('re|are)\s+)?(excited|happy|pleased|thrilled|proud)\s+to\s+announce",
-        r"^(we('re|are)\s+)?(excited|happy|pleased|thrilled|proud)\s+to\s+share",
-        r"^(we('re|are)\s+)?(excited|happy|pleased|thrilled|proud)\s+to\s+introduce",
-        r"^read more below",
-        r"^here'?s what'?s (new|changed|coming|happening)",
-        r"^check (it )?out",
-        r"^what'?s new\??$",
-        r"^overview:?$",
-        r"^introduction:?$",
-        r"^summary:?$",
-        r"^in this (update|release|post)",
-        r"^today,?\s+we('re|are)\s+(releasing|launching|announcing|introducing|shipping)",
-        r"^(starting|beginning)\s+(today|now),?\s+",
-    ]
-]
+# Filler/preamble patterns that don't add value in a summary, fused into one
+# alternation so each candidate sentence is matched in a single regex call.
+_FILLER_RE = re.compile("|".join(f"(?:{p})" for p in [
+    r"^(we('re|are)\s+)?(excited|happy|pleased|thrilled|proud)\s+to\s+announce",
+    r"^(we('re|are)\s+)?(excited|happy|pleased|thrilled|proud)\s+to\s+share",
+    r"^(we('re|are)\s+)?(excited|happy|pleased|thrilled|proud)\s+to\s+introduce",
+    r"^read more below",
+    r"^here'?s what'?s (new|changed|coming|happening)",
+    r"^check (it )?out",
+    r"^what'?s new\??$",
+    r"^overview:?$",
+    r"^introduction:?$",
+    r"^summary:?$",
+    r"^in this (update|release|post)",
+    r"^today,?\s+we('re|are)\s+(releasing|launching|announcing|introducing|shipping)",
+    r"^(starting|beginning)\s+(today|now),?\s+",
+]), re.IGNORECASE)
 
 
 def _is_filler_sentence(sentence: str) -> bool:
     """Return True if the sentence is preamble/filler that doesn't describe the feature."""
-    return any(p.search(sentence.strip()) for p in _FILLER_PATTERNS)
+    return _FILLER_RE.search(sentence.strip()) is not None
+
+
+_TRAILING_ELLIPSIS_RE = re.compile(r'\s*…\s*$')
+_TRAILING_FRAGMENT_RE = re.compile(r'^(.*[.!?])\s+\S[^.!?]*$', re.DOTALL)
 
 
 def _normalize_summary_text(text: str) -> str:
@@ -631,13 +942,13 @@ def _normalize_summary_text(text: str) -> str:
     if not text:
         return text
     # Clean up punctuation artifacts
-    text = re.sub(r'\.…', '.', text)
-    text = re.sub(r'…\.', '.', text)
-    text = re.sub(r'\.\.+', '.', text)
+    text = _DOT_ELLIPSIS_RE.sub('.', text)
+    text = _ELLIPSIS_DOT_RE.sub('.', text)
+    text = _MULTI_DOT_RE.sub('.', text)
     # Remove trailing ellipsis (incomplete thought)
-    text = re.sub(r'\s*…\s*$', '.', text)
+    text = _TRAILING_ELLIPSIS_RE.sub('.', text)
     # Remove trailing fragments after the last sentence-ending punctuation
-    match = re.match(r'^(.*[.!?])\s+\S[^.!?]*$', text, re.DOTALL)
+    match = _TRAILING_FRAGMENT_RE.match(text)
     if match:
         text = match.group(1).strip()
     # Ensure it ends with punctuation
@@ -646,6 +957,9 @@ def _normalize_summary_text(text: str) -> str:
     return text
 
 
+_CONTENT_WORD_RE = re.compile(r"[a-z0-9.]+")
+
+
 def _echoes_title(sentence: str, title: str) -> bool:
     """True if a sentence essentially just restates the title.
 
@@ -655,7 +969,7 @@ def _echoes_title(sentence: str, title: str) -> bool:
     images for GitHub Actions are now available…") is kept.
     """
     def content_words(s: str) -> set:
-        return {w for w in re.findall(r"[a-z0-9.]+", s.lower()) if len(w) > 3}
+        return {w for w in _CONTENT_WORD_RE.findall(s.lower()) if len(w) > 3}
 
     sentence_words = content_words(sentence)
     title_words = content_words(title)
@@ -665,6 +979,15 @@ def _echoes_title(sentence: str, title: str) -> bool:
     return len(novel) <= 1 and len(sentence) <= len(title) + 25
 
 
+def _iter_sentences(text: str) -> Iterator[str]:
+    """Yield stripped sentences one at a time (a lazy _SENTENCE_SPLIT_RE.split)."""
+    pos = 0
+    for match in _SENTENCE_SPLIT_RE.finditer(text):
+        yield text[pos:match.start()].strip()
+        pos = match.end()
+    yield text[pos:].strip()
+
+
 def extract_detailed_summary(entry: ChangelogEntry) -> str:
     """
     Extract a concise, well-formed summary from the changelog entry.
@@ -673,19 +996,21 @@ def extract_detailed_summary(entry: ChangelogEntry) -> str:
     if entry.content_html:
         text = _clean_html_to_text(entry.content_html)
 
-        # Meaningful sentences: drop short fragments and filler/preamble.
-        sentences = [s.strip() for s in re.split(r'(?<=[.!?])\s+', text)]
-        candidates = [s for s in sentences if len(s) >= 15 and not _is_filler_sentence(s)]
+        # Meaningful sentences: drop short fragments and filler/preamble. Lazy,
+        # so a long post is only split as far as the 350-char budget reaches.
+        candidates = (s for s in _iter_sentences(text)
+                      if len(s) >= 15 and not _is_filler_sentence(s))
+        head = list(islice(candidates, 2))
 
         # Drop a leading sentence that merely restates the title (e.g. "X is now
         # in public preview.") when there's substantive text after it, so the
         # summary leads with what shipped rather than echoing the headline.
-        if len(candidates) > 1 and _echoes_title(candidates[0], entry.title):
-            candidates = candidates[1:]
+        if len(head) > 1 and _echoes_title(head[0], entry.title):
+            head = head[1:]
 
         summary_sentences = []
         char_count = 0
-        for sentence in candidates:
+        for sentence in chain(head, candidates):
             if char_count + len(sentence) <= 350:
                 summary_sentences.append(sentence)
                 char_count += len(sentence)
@@ -705,12 +1030,15 @@ def extract_detailed_summary(entry: ChangelogEntry) -> str:
 
 
 # Function words that read as dangling if a condensed bullet ends on them.
-_TRAILING_STOPWORDS = {
+_TRAILING_STOPWORDS = frozenset({
     "and", "or", "but", "with", "to", "the", "a", "an", "of", "for", "in", "on",
     "by", "that", "as", "at", "from", "into", "so", "which", "while", "when",
     "where", "this", "giving", "allowing", "letting", "including", "such",
     "its", "their", "your", "our", "his", "her", "my", "it", "they", "you", "we",
-}
+})
+
+
+_UNCLOSED_PAREN_RE = re.compile(r'\s*\([^)]*$')
 
 
 def _condense_feature(text: str, limit: int = 140) -> str:
@@ -721,13 +1049,13 @@ def _condense_feature(text: str, limit: int = 140) -> str:
     failing that the leading clause before a comma, trimming any dangling
     fragment left by the cut.
     """
-    text = re.split(r'(?<=[.!?])\s+', text.strip())[0].strip()
+    text = _SENTENCE_SPLIT_RE.split(text.strip())[0].strip()
     if len(text) > limit:
         head = text[:limit]
         # Prefer cutting at the last comma; otherwise the last word boundary.
         text = head.rsplit(",", 1)[0] if "," in head else head.rsplit(" ", 1)[0]
     # Drop a trailing unclosed parenthetical left by the cut, e.g. "... jobs (i.e".
-    text = re.sub(r'\s*\([^)]*$', '', text)
+    text = _UNCLOSED_PAREN_RE.sub('', text)
     words = text.rstrip(".,;:").split()
     while words and words[-1].lower().strip(".,;:") in _TRAILING_STOPWORDS:
         words.pop()
@@ -736,27 +1064,36 @@ def _condense_feature(text: str, limit: int = 140) -> str:
 
 # Lowercase CLI/command tokens that must never be title-cased when they lead a
 # feature bullet (e.g. "gh discussion list" must not become "Gh discussion list").
-_COMMAND_PREFIXES = {
+_COMMAND_PREFIXES = frozenset({
     "gh", "git", "npm", "npx", "pip", "pipx", "pnpm", "yarn", "curl", "wget",
     "docker", "kubectl", "brew", "dotnet", "cargo", "bundle", "gem", "mvn",
     "gradle", "terraform", "aws", "gcloud", "ssh", "scp", "psql",
-}
+})
+
+
+_LEADING_BULLET_RE = re.compile(r'^[\-\u2022\u2013\u2014\*]\s*')
+_LEADING_NUMBER_RE = re.compile(r'^\d+[.)]\s*')
+_TRAILING_COLONS_RE = re.compile(r':+\s*$')
+_WORD_UNDERSCORE_RE = re.compile(r'(?<=[a-zA-Z])_(?=[a-zA-Z])')
+# Install/import hints marking a bullet as code, where underscores are literal.
+# One alternation scans the text once instead of once per hint.
+_CODE_HINT_RE = re.compile(r'install|import|go get|dotnet|pip|npm|require', re.IGNORECASE)
 
 
 def _normalize_feature_text(text: str) -> str:
     """Clean and normalize a single feature bullet point."""
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
     # Fix spaces before punctuation
-    text = re.sub(r'\s+([,;:.!?])', r'\1', text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
     # Strip leading bullets, dashes, or numbering
-    text = re.sub(r'^[\-\u2022\u2013\u2014\*]\s*', '', text)
-    text = re.sub(r'^\d+[.)]\s*', '', text)
+    text = _LEADING_BULLET_RE.sub('', text)
+    text = _LEADING_NUMBER_RE.sub('', text)
     # Strip trailing colons (leftover from headers used as list items)
-    text = re.sub(r':+\s*$', '', text)
+    text = _TRAILING_COLONS_RE.sub('', text)
     # Replace underscores with spaces in display text (e.g., Find_symbol -> Find symbol)
     # but not in code-like strings (e.g., npm install, pip install, dotnet add)
-    if not any(kw in text.lower() for kw in ['install', 'import', 'go get', 'dotnet', 'pip', 'npm', 'require']):
-        text = re.sub(r'(?<=[a-zA-Z])_(?=[a-zA-Z])', ' ', text)
+    if not _CODE_HINT_RE.search(text):
+        text = _WORD_UNDERSCORE_RE.sub(' ', text)
     # Capitalize the first letter — but skip code tokens (.NET, @handle) and CLI
     # command names (gh, git, npm, ...), where the lowercase form is intentional.
     first_word = text.split(maxsplit=1)[0].lower() if text else ""
@@ -825,7 +1162,7 @@ def extract_key_features(entry: ChangelogEntry) -> list[str]:
     bold_features = []
 
     if entry.content_html:
-        soup = BeautifulSoup(entry.content_html, "html.parser")
+        soup = _parse_html(entry.content_html)
 
         # List items are the reliable source of demoable capabilities.
         for li in soup.find_all("li"):
@@ -847,21 +1184,27 @@ def extract_key_features(entry: ChangelogEntry) -> list[str]:
         # Bold/strong text is usually a section heading, not a feature, so use it
         # only as a fallback when the post has no usable list items — and require
         # real length so one-word headings ("Security") don't become bullets.
-        for strong in soup.find_all(["strong", "b"]):
-            text = strong.get_text().strip()
-            if 15 < len(text) < 80:
-                text = _normalize_feature_text(text)
-                if text:
-                    bold_features.append(text)
+        # Skip the scan entirely when list items were found.
+        if not (natural_li or condensed_li):
+            for strong in soup.find_all(["strong", "b"]):
+                text = strong.get_text().strip()
+                if 15 < len(text) < 80:
+                    text = _normalize_feature_text(text)
+                    if text:
+                        bold_features.append(text)
 
     # Prefer complete list items; fill with condensed-long items; fall back to
     # bold headings only when there are no list items at all.
     li_features = natural_li + condensed_li
     features = li_features if li_features else bold_features
 
-    # Deduplicate: remove features that are substrings of the title or of each other
+    # Deduplicate: remove features that are substrings of the title or of each
+    # other. Kept items never depend on later ones, so stop once 4 are kept.
     deduped = []
+    kept_lower = []  # lowercased twin of deduped, so kept items aren't re-lowered per candidate
     for f in features:
+        if len(deduped) == 4:
+            break
         f_lower = f.lower()
         # Skip if it's essentially the title restated
         if f_lower in title_lower or title_lower in f_lower:
@@ -873,11 +1216,12 @@ def extract_key_features(entry: ChangelogEntry) -> list[str]:
         if _is_vague_bullet(f):
             continue
         # Skip if it's a substring of an already-kept feature
-        if any(f_lower in kept.lower() or kept.lower() in f_lower for kept in deduped):
+        if any(f_lower in kept or kept in f_lower for kept in kept_lower):
             continue
         deduped.append(f)
+        kept_lower.append(f_lower)
 
-    return deduped[:4]
+    return deduped
 
 
 # Default model for the optional LLM features — a small, fast, inexpensive model
@@ -960,6 +1304,10 @@ def llm_summary(entry: ChangelogEntry) -> Optional[str]:
     return _normalize_summary_text(text) if text else None
 
 
+# Leading bullet/numbering the model may emit despite instructions.
+_LLM_BULLET_PREFIX_RE = re.compile(r'^[\-\*•–—\d.\)\s]+')
+
+
 def llm_key_features(title: str, content_html: str = "", summary: str = "") -> Optional[list[str]]:
     """Optional, goal-tuned key-feature bullets via the Anthropic API.
 
@@ -982,7 +1330,7 @@ def llm_key_features(title: str, content_html: str = "", summary: str = "") -> O
         return None  # call failed -> let the caller use the heuristic
     bullets = []
     for line in text.splitlines():
-        line = re.sub(r'^[\-\*•–—\d.\)\s]+', '', line).strip()
+        line = _LLM_BULLET_PREFIX_RE.sub('', line).strip()
         if len(line) > 2:
             cleaned = _normalize_feature_text(line)
             if cleaned:
@@ -994,12 +1342,10 @@ def _all_embedded_docs_links(content_html: str) -> list[str]:
     """Every distinct docs.github.com link the post embeds (tracking stripped)."""
     out = []
     if content_html:
-        for a in BeautifulSoup(content_html, "html.parser").find_all("a", href=True):
-            href = a["href"]
-            if "docs.github.com" in href and not href.startswith("#"):
-                clean = _strip_tracking(href)
-                if clean not in out:
-                    out.append(clean)
+        for href in _docs_hrefs(content_html):
+            clean = _strip_tracking(href)
+            if clean not in out:
+                out.append(clean)
     return out
 
 
@@ -1038,8 +1384,72 @@ def llm_pick_docs_url(title: str, content_html: str = "", summary: str = "") ->
     return None
 
 
+# Resolved docs links persisted across runs, so a re-processed entry (a --all
+# run, a retried send, a local preview) skips the scrape-and-validate round
+# trips. Keyed by a digest of everything resolution depends on; only found
+# links are cached, so a transient lookup failure is retried next run.
+_DOCS_CACHE_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "docs_cache.json")
+DOCS_CACHE_TTL_DAYS = 7
+
+
+def _docs_cache_key(entry: ChangelogEntry) -> str:
+    """Digest of the inputs search_docs_for_release sees for this entry.
+
+    The title is case/whitespace-normalized (resolution lowercases it anyway),
+    so trivially re-worded duplicates share one lookup.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    title = " ".join(entry.title.lower().split())
+    for part in ("llm" if _llm_enabled() else "", title, entry.content_html,
+                 entry.detailed_summary or entry.summary or ""):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _load_docs_cache() -> dict:
+    """Load unexpired cache records ({key: {"url": ..., "ts": epoch}})."""
+    try:
+        with open(_DOCS_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    # A truncated or hand-edited file can still parse; any unexpected shape is
+    # treated as a miss rather than aborting the run.
+    if not isinstance(cache, dict):
+        return {}
+    cutoff = time.time() - DOCS_CACHE_TTL_DAYS * 86400
+    return {
+        k: v for k, v in cache.items()
+        if isinstance(v, dict) and isinstance(v.get("url"), str)
+        and isinstance(v.get("ts"), (int, float)) and v["ts"] > cutoff
+    }
+
+
+def _save_docs_cache(cache: dict) -> None:
+    try:
+        os.makedirs(os.path.dirname(_DOCS_CACHE_FILE), exist_ok=True)
+        with open(_DOCS_CACHE_FILE, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"  ⚠️  Could not write docs cache: {e}")
+
+
+def _resolve_docs_url(entry: ChangelogEntry) -> Optional[str]:
+    """Resolve one entry's docs link (network-bound; run on a worker thread)."""
+    return search_docs_for_release(
+        entry.title, entry.content_html, entry.detailed_summary or entry.summary or ""
+    )
+
+
 def enrich_entries(entries: list[ChangelogEntry]) -> list[ChangelogEntry]:
-    """Attach a cleaned summary, key features, and a verified docs link to each entry."""
+    """Attach a cleaned summary, key features, and a verified docs link to each entry.
+
+    Docs resolution is pure network I/O (several fetches per entry), so entries
+    without an override are resolved concurrently on a small thread pool, after
+    consulting the on-disk cache of links resolved by earlier runs.
+    """
+    to_resolve = []
     for entry in entries:
         # Prefer LLM-written summary/features when explicitly enabled; otherwise
         # (and on any failure) fall back to the heuristic extractors. For features,
@@ -1056,13 +1466,38 @@ def enrich_entries(entries: list[ChangelogEntry]) -> list[ChangelogEntry]:
             entry.docs_url = override  # a verified URL, or None to show no link
             print(f"  ✅ Verified docs override: {override or '(no docs link)'}")
             continue
-
-        # Otherwise resolve the most accurate documentation URL. Only sets docs_url
-        # if the page is verified as genuinely relevant (else the template omits it).
-        print(f"  🔍 Searching docs for: {entry.title[:50]}...")
-        entry.docs_url = search_docs_for_release(
-            entry.title, entry.content_html, entry.detailed_summary or entry.summary or ""
-        )
+        to_resolve.append(entry)
+
+    # Otherwise resolve the most accurate documentation URL. Only sets docs_url
+    # if the page is verified as genuinely relevant (else the template omits it).
+    if not to_resolve:
+        return entries
+
+    cache = _load_docs_cache()
+    misses = {}  # cache key -> entries awaiting that lookup (resolved once)
+    for entry in to_resolve:
+        key = _docs_cache_key(entry)
+        hit = cache.get(key)
+        if hit:
+            entry.docs_url = hit["url"]
+            print(f"  ✅ Cached docs link: {hit['url']}")
+        else:
+            misses.setdefault(key, []).append(entry)
+
+    if misses:
+        # One progress line for the whole batch rather than one per worker
+        # (per-entry lines from concurrent threads interleave anyway).
+        print(f"  🔍 Searching docs for {len(misses)} entr{'y' if len(misses) == 1 else 'ies'} "
+              f"({len(to_resolve) - sum(map(len, misses.values()))} cached)...")
+        workers = min(DOCS_LOOKUP_WORKERS, len(misses))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            leaders = [group[0] for group in misses.values()]
+            for (key, group), docs_url in zip(misses.items(), pool.map(_resolve_docs_url, leaders)):
+                for entry in group:
+                    entry.docs_url = docs_url
+                if docs_url:
+                    cache[key] = {"url": docs_url, "ts": time.time()}
+        _save_docs_cache(cache)
 
     return entries
 
@@ -1100,26 +1535,28 @@ def _safe_href(url: Optional[str]) -> str:
     return url if urlsplit(url).scheme.lower() in ("http", "https") else ""
 
 
+def _entry_to_dict(e: ChangelogEntry) -> dict:
+    """One entry as the dict the email template consumes."""
+    # Prefer the cleaned detailed_summary; fall back to the RSS summary.
+    if e.detailed_summary:
+        summary_text = e.detailed_summary
+    elif e.summary:
+        summary_text = _clean_html_to_text(e.summary)
+    else:
+        summary_text = ""
+
+    return {
+        "title": e.title,
+        "url": _safe_href(e.url),
+        "published": e.published,
+        "summary": summary_text,
+        "category": e.category,
+        "labels": _fit_labels(e.labels),
+        "docs_url": _safe_href(e.docs_url),
+        "key_features": e.key_features,
+    }
+
+
 def entries_to_dict(entries: list[ChangelogEntry]) -> list[dict]:
     """Convert entries to the dicts the email template consumes."""
-    result = []
-    for e in entries:
-        # Prefer the cleaned detailed_summary; fall back to the RSS summary.
-        if e.detailed_summary:
-            summary_text = e.detailed_summary
-        elif e.summary:
-            summary_text = _clean_html_to_text(e.summary)
-        else:
-            summary_text = ""
-
-        result.append({
-            "title": e.title,
-            "url": _safe_href(e.url),
-            "published": e.published,
-            "summary": summary_text,
-            "category": e.category,
-            "labels": _fit_labels(e.labels),
-            "docs_url": _safe_href(e.docs_url),
-            "key_features": e.key_features,
-        })
-    return result
+    return [_entry_to_dict(e) for e in entries]
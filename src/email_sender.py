@@ -2,8 +2,10 @@
 
 import os
 import smtplib
+import socket
 import ssl
 from datetime import datetime
+from email.charset import Charset
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formatdate, make_msgid
@@ -17,6 +19,15 @@ PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
 
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "..", "templates")
 
+# One Jinja2 environment per process. It caches compiled templates, so the
+# digest template is read and compiled once rather than on every build; with
+# auto_reload off, later renders skip the on-disk freshness check too.
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    autoescape=True,
+    auto_reload=False,
+)
+
 
 def _mask_email(email: str) -> str:
     """Mask an address for logging, e.g. 'alice@github.com' -> 'a***@github.com'.
@@ -41,6 +52,26 @@ def _compact_html(html: str) -> str:
     return "\n".join(line for line in lines if line)
 
 
+# UTF-8 with no transfer encoding, for servers that accept 8BITMIME: the body is
+# sent as-is instead of being base64-encoded (~33% larger on the wire).
+_UTF8_8BIT = Charset("utf-8")
+_UTF8_8BIT.body_encoding = None
+
+# RFC 5322 line-length limit (excluding CRLF); 8bit bodies are not re-wrapped,
+# so they may only be used when every line already fits. Measured on the str
+# bodies, whose lines go out unchanged apart from the CRLF terminator.
+_MAX_LINE_BYTES = 998
+
+
+def _fits_8bit(*bodies: Optional[str]) -> bool:
+    """True when every line of every body fits SMTP's line limit as UTF-8."""
+    return all(
+        len(line.encode("utf-8")) <= _MAX_LINE_BYTES
+        for body in bodies if body
+        for line in body.splitlines()
+    )
+
+
 def build_email_html(
     releases: list[dict],
     improvements: list[dict],
@@ -48,8 +79,7 @@ def build_email_html(
     digest_date: Optional[str] = None,
 ) -> str:
     """Build the HTML email content using Jinja2 template."""
-    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR), autoescape=True)
-    template = env.get_template("digest_email.html")
+    template = _JINJA_ENV.get_template("digest_email.html")
 
     if digest_date is None:
         digest_date = datetime.now(tz=PACIFIC_TZ).strftime("%A, %B %-d, %Y")
@@ -127,6 +157,37 @@ def build_email_text(
     return "\n".join(lines) + "\n"
 
 
+# timeout bounds a hung/half-open SMTP endpoint; without it the socket
+# inherits the global default (None = block forever) and the only backstop is
+# the workflow's 5-minute job kill.
+_SMTP_TIMEOUT = 30
+
+# Connection setup (connect + STARTTLS + login) is tried this many times. A
+# dropped or timed-out handshake is usually transient, and nothing has been
+# sent yet, so reconnecting is safe. Sends themselves are never retried here: a
+# failed recipient is reported and the whole run retries next time.
+_SMTP_CONNECT_ATTEMPTS = 2
+
+
+def _open_smtp(host: str, port: int, user: str, password: str,
+               context: ssl.SSLContext) -> smtplib.SMTP:
+    """Connect, STARTTLS and log in, reconnecting once on a dropped/timed-out handshake."""
+    for attempt in range(1, _SMTP_CONNECT_ATTEMPTS + 1):
+        server = None
+        try:
+            server = smtplib.SMTP(host, port, timeout=_SMTP_TIMEOUT)
+            server.starttls(context=context)
+            server.login(user, password)
+            return server
+        except Exception as e:
+            if server is not None:
+                server.close()
+            retryable = isinstance(e, (smtplib.SMTPServerDisconnected, socket.timeout))
+            if not retryable or attempt == _SMTP_CONNECT_ATTEMPTS:
+                raise
+            print(f"⚠️  SMTP handshake failed ({str(e) or type(e).__name__}); reconnecting...")
+
+
 def send_email(
     to_emails: list[str],
     subject: str,
@@ -152,41 +213,54 @@ def send_email(
     context = ssl.create_default_context()
 
     try:
-        # timeout bounds a hung/half-open SMTP endpoint; without it the socket
-        # inherits the global default (None = block forever) and the only
-        # backstop is the workflow's 5-minute job kill.
-        with smtplib.SMTP(smtp_host, smtp_port, timeout=30) as server:
-            server.starttls(context=context)
-            server.login(smtp_user, smtp_password)
-
+        with _open_smtp(smtp_host, smtp_port, smtp_user, smtp_password, context) as server:
             sender_domain = from_email.split("@")[-1] if "@" in (from_email or "") else None
+            # Everything but To/Date/Message-ID is identical for every recipient,
+            # so build the message (and encode its body parts) once and swap only
+            # those headers per send. Each recipient still gets an individual
+            # message and SMTP transaction.
+            msg = MIMEMultipart("alternative")
+            msg["Subject"] = subject
+            msg["From"] = from_email
+            # A mailto-based unsubscribe; the maintainer processes opt-outs
+            # by editing the DIGEST_TO_EMAIL secret. (No List-Unsubscribe-Post
+            # / One-Click: that requires an authenticated https endpoint.)
+            msg["List-Unsubscribe"] = f"<mailto:{from_email}?subject=unsubscribe>"
+
+            # Send the body as raw UTF-8 when the server advertises 8BITMIME
+            # (Gmail and effectively every modern MTA do) and no line is too
+            # long; otherwise fall back to base64 transfer encoding.
+            eight_bit = server.has_extn("8bitmime") and _fits_8bit(text_content, html_content)
+            mail_options = ["BODY=8BITMIME"] if eight_bit else []
+
+            # multipart/alternative is least-rich-first: attach plain
+            # text before HTML so text-only clients pick it up.
+            if text_content:
+                msg.attach(MIMEText(text_content, "plain", _UTF8_8BIT if eight_bit else "utf-8"))
+            msg.attach(MIMEText(html_content, "html", _UTF8_8BIT if eight_bit else None))
+
+            # SMTP requires CRLF line endings, and smtplib only normalizes them
+            # for str messages — bytes are sent verbatim — so serialize with
+            # CRLF ourselves (same compat32 rules otherwise).
+            wire_policy = msg.policy.clone(linesep="\r\n")
+
             for email in to_emails:
                 try:
-                    # Create message
-                    msg = MIMEMultipart("alternative")
-                    msg["Subject"] = subject
-                    msg["From"] = from_email
-                    msg["To"] = email
                     # smtplib.sendmail() transmits the message verbatim and adds
                     # no headers, so set Date and a unique Message-ID ourselves —
                     # their absence is a spam signal (e.g. MISSING_MID) and can
                     # cause client threading oddities. make_msgid() is unique
                     # even when called back-to-back, so each copy gets its own ID.
-                    msg["Date"] = formatdate(localtime=True)
-                    msg["Message-ID"] = make_msgid(domain=sender_domain)
-                    # A mailto-based unsubscribe; the maintainer processes opt-outs
-                    # by editing the DIGEST_TO_EMAIL secret. (No List-Unsubscribe-Post
-                    # / One-Click: that requires an authenticated https endpoint.)
-                    msg["List-Unsubscribe"] = f"<mailto:{from_email}?subject=unsubscribe>"
-
-                    # multipart/alternative is least-rich-first: attach plain
-                    # text before HTML so text-only clients pick it up.
-                    if text_content:
-                        msg.attach(MIMEText(text_content, "plain", "utf-8"))
-                    msg.attach(MIMEText(html_content, "html"))
+                    for name, value in (
+                        ("To", email),
+                        ("Date", formatdate(localtime=True)),
+                        ("Message-ID", make_msgid(domain=sender_domain)),
+                    ):
+                        del msg[name]
+                        msg[name] = value
 
                     # Send
-                    server.sendmail(from_email, email, msg.as_string())
+                    server.sendmail(from_email, email, msg.as_bytes(policy=wire_policy), mail_options)
                     print(f"  ✓ Email sent to {_mask_email(email)}")
                     success_count += 1
                 except Exception as e:
@@ -240,13 +314,16 @@ def send_digest_email(
 
     # Build email content (shared digest date keeps the HTML and text parts in
     # sync) — HTML plus a plain-text alternative for deliverability/accessibility.
-    digest_date = datetime.now(tz=PACIFIC_TZ).strftime("%A, %B %-d, %Y")
+    # One clock read feeds the body and the subject, so a send that straddles
+    # midnight can't show two different days.
+    now = datetime.now(tz=PACIFIC_TZ)
+    digest_date = now.strftime("%A, %B %-d, %Y")
     html_content = build_email_html(releases, improvements, retirements, digest_date)
     text_content = build_email_text(releases, improvements, retirements, digest_date)
 
     # Build subject line
     total_items = len(releases) + len(improvements) + len(retirements)
-    date_str = datetime.now(tz=PACIFIC_TZ).strftime("%a, %b %-d")
+    date_str = now.strftime("%a, %b %-d")
     update_word = "update" if total_items == 1 else "updates"
     if total_items == 0:
         subject = f"No changelog updates today · {date_str}"
@@ -10,6 +10,7 @@ a beautifully formatted email digest.
 import argparse
 import sys
 from datetime import datetime
+from operator import attrgetter
 
 from changelog import (
     fetch_changelog,
@@ -18,7 +19,7 @@ from changelog import (
     entries_to_dict,
 )
 from state import (
-    load_processed_urls,
+    load_processed_state,
     save_processed_urls,
     filter_new_entries,
     mark_entries_as_processed,
@@ -59,7 +60,10 @@ def main():
 
     # Step 1: Load previously processed URLs
     print("📂 Loading state...")
-    processed_urls = load_processed_urls()
+    # Keep the timestamped mapping so the save in step 10 reuses it rather than
+    # re-reading the state file.
+    processed_state = load_processed_state()
+    processed_urls = frozenset(processed_state)
     print(f"   Found {len(processed_urls)} previously processed entries")
 
     # Step 2: Fetch changelog entries (only from the past 7 days)
@@ -73,10 +77,7 @@ def main():
         new_entries = all_entries
     else:
         print("🔍 Filtering new entries...")
-        # Convert to dict format for filtering
-        all_entries_dict = [{"url": e.url, "entry": e} for e in all_entries]
-        new_entries_dict = filter_new_entries(all_entries_dict, processed_urls)
-        new_entries = [e["entry"] for e in new_entries_dict]
+        new_entries = filter_new_entries(all_entries, processed_urls, key=attrgetter("url"))
     print(f"   Found {len(new_entries)} entries to process")
 
     # Step 4: Check if we have anything to send
@@ -97,20 +98,17 @@ def main():
 
     # Step 6: Enrich all entries with summary, key features, and a docs link
     print("📝 Enriching entries with summaries and documentation links...")
-    enriched_releases = enrich_entries(categorized["releases"])
-    enriched_improvements = enrich_entries(categorized["improvements"])
-    enriched_retirements = enrich_entries(categorized["retirements"])
-    categorized["releases"] = enriched_releases
-    categorized["improvements"] = enriched_improvements
-    categorized["retirements"] = enriched_retirements
+    # One call across every category so docs lookups share a single thread pool
+    # (entries are enriched in place, so the categorized lists stay current).
+    all_enriched = enrich_entries(
+        categorized["releases"] + categorized["improvements"] + categorized["retirements"]
+    )
 
     # Docs-link coverage: surfaced in CI logs so accuracy regressions are visible
-    all_enriched = enriched_releases + enriched_improvements + enriched_retirements
-    linked_count = sum(1 for e in all_enriched if e.docs_url)
-    print(f"   Docs links resolved: {linked_count}/{len(all_enriched)} entries")
-    for e in all_enriched:
-        if not e.docs_url:
-            print(f"     ⚠️  no docs link: {e.title[:70]}")
+    unlinked = [e for e in all_enriched if not e.docs_url]
+    print(f"   Docs links resolved: {len(all_enriched) - len(unlinked)}/{len(all_enriched)} entries")
+    for e in unlinked:
+        print(f"     ⚠️  no docs link: {e.title[:70]}")
 
     # Step 7: Convert to dict format for templating
     releases = entries_to_dict(categorized["releases"])
@@ -142,11 +140,8 @@ def main():
 
     # Step 10: Update state
     print("💾 Updating state...")
-    new_urls = mark_entries_as_processed(
-        [{"url": e.url} for e in new_entries],
-        processed_urls
-    )
-    save_processed_urls(new_urls)
+    new_urls = mark_entries_as_processed(new_entries, processed_urls, key=attrgetter("url"))
+    save_processed_urls(new_urls, existing=processed_state)
     print(f"   State now contains {len(new_urls)} processed entries")
 
     print("-" * 60)
@@ -6,8 +6,9 @@ Automatically prunes entries older than MAX_AGE_DAYS to prevent unbounded growth
 
 import json
 import os
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import Set, Dict
+from typing import AbstractSet, Callable, FrozenSet, Set, Dict, Optional
 
 STATE_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "state.json")
 MAX_AGE_DAYS = 90  # Prune entries older than this
@@ -51,25 +52,32 @@ def _prune_old_entries(urls_with_timestamps: Dict[str, str]) -> Dict[str, str]:
     }
 
 
-def load_processed_urls() -> Set[str]:
-    """Load the set of previously processed entry URLs from state file."""
+def load_processed_state() -> Dict[str, str]:
+    """Load processed entry URLs with their timestamps (migrated and pruned)."""
     data = _load_raw_state()
     urls_with_timestamps = _migrate_if_needed(data)
     # Prune on load to keep state clean
-    pruned = _prune_old_entries(urls_with_timestamps)
-    return set(pruned.keys())
+    return _prune_old_entries(urls_with_timestamps)
+
+
+def load_processed_urls() -> FrozenSet[str]:
+    """Load the set of previously processed entry URLs from state file."""
+    return frozenset(load_processed_state())
 
 
-def save_processed_urls(urls: Set[str]) -> None:
+def save_processed_urls(urls: Set[str], existing: Optional[Dict[str, str]] = None) -> None:
     """
     Save the set of processed entry URLs to state file.
     Preserves existing timestamps and adds new ones for new URLs.
+
+    Pass the mapping from load_processed_state() as ``existing`` to reuse it
+    instead of reading and migrating the state file a second time.
     """
     os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
     
     # Load existing timestamps
-    data = _load_raw_state()
-    existing = _migrate_if_needed(data)
+    if existing is None:
+        existing = _migrate_if_needed(_load_raw_state())
     
     # Merge: keep existing timestamps, add new URLs with current timestamp
     now = datetime.now().isoformat()
@@ -78,19 +86,30 @@ def save_processed_urls(urls: Set[str]) -> None:
     # Prune old entries before saving
     pruned = _prune_old_entries(merged)
     
-    # Sort by timestamp (newest first) for readability
-    sorted_urls = dict(sorted(pruned.items(), key=lambda x: x[1], reverse=True))
+    # Sort by timestamp (newest first). Not just for readability: `urls` is a
+    # set, so without a fixed order every save would shuffle the committed
+    # file and bury the day's real change in a noisy diff.
+    sorted_urls = dict(sorted(pruned.items(), key=itemgetter(1), reverse=True))
     
     with open(STATE_FILE, "w") as f:
         json.dump({"processed_urls": sorted_urls}, f, indent=2)
 
 
-def filter_new_entries(entries: list, processed_urls: Set[str]) -> list:
+# Default URL accessor: entries are dicts with a "url" key. Pass
+# key=operator.attrgetter("url") to work on entry objects directly.
+_URL_KEY = itemgetter("url")
+
+
+def filter_new_entries(entries: list, processed_urls: AbstractSet[str],
+                       key: Callable = _URL_KEY) -> list:
     """Filter out entries that have already been processed."""
-    return [entry for entry in entries if entry["url"] not in processed_urls]
+    if not processed_urls:
+        return list(entries)  # first run / fully pruned state: everything is new
+    return [entry for entry in entries if key(entry) not in processed_urls]
 
 
-def mark_entries_as_processed(entries: list, processed_urls: Set[str]) -> Set[str]:
+def mark_entries_as_processed(entries: list, processed_urls: AbstractSet[str],
+                              key: Callable = _URL_KEY) -> Set[str]:
     """Add entry URLs to the processed set and return the updated set."""
-    new_urls = {entry["url"] for entry in entries}
+    new_urls = {key(entry) for entry in entries}
     return processed_urls | new_urls
@@ -1,5 +1,6 @@
 """Tests for changelog parsing, categorization, and the pure display helpers."""
 
+import io
 import sys
 import types
 from datetime import datetime, timezone
@@ -17,6 +18,109 @@ def _entry(category="Improvement", title="t", labels=None):
     )
 
 
+# --- fetch_changelog (conditional GET) ---------------------------------------
+
+def _feed_xml():
+    pub = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>c</title>'
+        f'<item><title>Feed item</title><link>https://github.blog/changelog/x</link>'
+        f'<pubDate>{pub}</pubDate><description>Body</description>'
+        '<category domain="changelog-type">Release</category></item>'
+        '</channel></rss>'
+    ).encode()
+
+
+class _FeedResp:
+    def __init__(self, status, content=b"", headers=None):
+        self.status_code = status
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+@pytest.fixture
+def feed_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cl, "_FEED_CACHE_FILE", str(tmp_path / "feed_cache.json"))
+    monkeypatch.setattr(cl, "_FEED_BODY_FILE", str(tmp_path / "feed_cache.xml"))
+    return tmp_path
+
+
+def test_fetch_changelog_reuses_cached_body_on_304(feed_cache, monkeypatch):
+    sent = []
+
+    def fake_get(url, headers=None, **k):
+        sent.append(headers or {})
+        if len(sent) == 1:
+            return _FeedResp(200, _feed_xml(), {"ETag": '"v1"'})
+        return _FeedResp(304)
+    monkeypatch.setattr(cl.requests, "get", fake_get)
+
+    first = cl.fetch_changelog()
+    second = cl.fetch_changelog()
+    assert sent[0] == {}                              # nothing cached yet
+    assert sent[1] == {"If-None-Match": '"v1"'}       # validator replayed
+    assert [e.title for e in first] == [e.title for e in second] == ["Feed item"]
+
+
+def test_fetch_changelog_without_validators_skips_cache(feed_cache, monkeypatch):
+    monkeypatch.setattr(cl.requests, "get", lambda *a, **k: _FeedResp(200, _feed_xml()))
+    assert len(cl.fetch_changelog()) == 1
+    assert not (feed_cache / "feed_cache.json").exists()
+
+
+def test_fetch_changelog_clears_cache_when_validators_disappear(feed_cache, monkeypatch):
+    responses = iter([_FeedResp(200, _feed_xml(), {"ETag": '"v1"'}), _FeedResp(200, _feed_xml())])
+    monkeypatch.setattr(cl.requests, "get", lambda *a, **k: next(responses))
+    cl.fetch_changelog()
+    assert (feed_cache / "feed_cache.json").exists()
+    cl.fetch_changelog()
+    assert not (feed_cache / "feed_cache.json").exists()
+    assert not (feed_cache / "feed_cache.xml").exists()
+    assert not list(feed_cache.glob("*.tmp"))
+
+
+def test_fetch_changelog_ignores_malformed_feed_cache(feed_cache, monkeypatch):
+    (feed_cache / "feed_cache.json").write_text('["not", "a", "dict"]')
+    (feed_cache / "feed_cache.xml").write_bytes(b"stale")
+    sent = []
+
+    def fake_get(url, headers=None, **k):
+        sent.append(headers or {})
+        return _FeedResp(200, _feed_xml())
+    monkeypatch.setattr(cl.requests, "get", fake_get)
+    assert len(cl.fetch_changelog()) == 1
+    assert sent == [{}]                               # plain full fetch
+
+
+def test_fetch_changelog_reads_tags_and_prefers_full_content(feed_cache, monkeypatch):
+    pub = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
+    xml = (
+        '<?xml version="1.0"?><rss version="2.0" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel><title>c</title>'
+        f'<item><title>T</title><link>https://github.blog/changelog/y</link><pubDate>{pub}</pubDate>'
+        '<description>Short</description><content:encoded><![CDATA[<p>Full body</p>]]></content:encoded>'
+        '<category domain="changelog-type">Retired</category>'
+        '<category domain="changelog-label">collaboration tools</category></item>'
+        '</channel></rss>'
+    ).encode()
+    monkeypatch.setattr(cl.requests, "get", lambda *a, **k: _FeedResp(200, xml))
+    [e] = cl.fetch_changelog()
+    assert e.category == "Retired"
+    assert e.labels == ["Collaboration Tools"]
+    assert e.summary == "Short"
+    assert e.content_html == "<p>Full body</p>"
+
+
+def test_fetch_changelog_raises_on_outage(feed_cache, monkeypatch):
+    monkeypatch.setattr(cl.requests, "get", lambda *a, **k: _FeedResp(503))
+    with pytest.raises(RuntimeError):
+        cl.fetch_changelog()
+
+
 # --- categorization ----------------------------------------------------------
 
 def test_categorize_routes_by_type():
@@ -69,6 +173,10 @@ def test_capitalize_label_unescapes_html_entities():
     assert cl._capitalize_label("ecosystem &amp; accessibility") == "Ecosystem & Accessibility"
 
 
+def test_capitalize_label_shares_one_string_per_label():
+    assert cl._capitalize_label("copilot") is cl._capitalize_label("copilot")
+
+
 def test_fit_labels_keeps_short_labels():
     assert cl._fit_labels(["API", "Actions"]) == ["API", "Actions"]
 
@@ -89,17 +197,30 @@ def test_convert_to_pst_formats_known_date():
     assert cl.convert_to_pst("Thu, 15 Jan 2026 21:57:44 +0000") == "Jan 15, 2026"
 
 
+def test_convert_to_pst_unpadded_day_in_pacific_time():
+    # 05:00 UTC on Jan 2 is still Jan 1 in Pacific Time; the day isn't zero-padded.
+    assert cl.convert_to_pst("Fri, 02 Jan 2026 05:00:00 +0000") == "Jan 1, 2026"
+
+
 def test_convert_to_pst_returns_original_on_garbage():
     assert cl.convert_to_pst("not a date") == "not a date"
 
 
 # --- validate_docs_url thresholds (strict vs non-strict) --------------------
 
+class _FakeRaw(io.BytesIO):
+    def read(self, n=-1, decode_content=False):
+        return super().read(n)
+
+
 class _FakeResp:
     def __init__(self, html):
         self.text = html
+        self.raw = _FakeRaw(html.encode())
     def raise_for_status(self):
         pass
+    def close(self):
+        pass
 
 
 def _page(*words):
@@ -107,6 +228,13 @@ def _page(*words):
     return f"<html><head><title>Docs</title></head><body>{body}</body></html>"
 
 
+@pytest.fixture(autouse=True)
+def _fresh_docs_fetch_caches():
+    # Page/search fetches are memoized per process; isolate each test's fakes.
+    cl._fetch_docs_page.cache_clear()
+    cl._search_docs_page.cache_clear()
+
+
 def test_validate_docs_url_threshold_boundary(monkeypatch):
     # Title keywords (after stop-word removal): copilot, code, review.
     title = "Copilot code review"
@@ -119,7 +247,33 @@ def test_validate_docs_url_threshold_boundary(monkeypatch):
 
     # Page mentions all 3 -> 1.0 ratio: passes both.
     monkeypatch.setattr(cl._DOCS_SESSION, "get", lambda *a, **k: _FakeResp(_page("copilot", "code", "review")))
-    assert cl.validate_docs_url("https://docs.github.com/x", title, strict=True) is True
+    assert cl.validate_docs_url("https://docs.github.com/y", title, strict=True) is True
+
+
+def test_validate_docs_url_accepts_on_page_title_alone(monkeypatch):
+    page = "<html><head><title>About Copilot code review</title></head><body>x</body></html>"
+    monkeypatch.setattr(cl._DOCS_SESSION, "get", lambda *a, **k: _FakeResp(page))
+    assert cl.validate_docs_url("https://docs.github.com/x", "Copilot code review", strict=True) is True
+
+
+def test_validate_docs_url_reads_a_bounded_prefix(monkeypatch):
+    monkeypatch.setattr(cl, "_MAX_DOCS_PAGE_BYTES", 200)
+    page = _page("copilot", "x" * 400, "code", "review")   # keywords past the cap
+    monkeypatch.setattr(cl._DOCS_SESSION, "get", lambda *a, **k: _FakeResp(page))
+    assert cl.validate_docs_url("https://docs.github.com/x", "Copilot code review", strict=True) is False
+
+
+def test_validate_docs_url_fetches_each_page_once(monkeypatch):
+    calls = []
+
+    def fake_get(url, *a, **k):
+        calls.append(url)
+        return _FakeResp(_page("copilot", "code", "review"))
+    monkeypatch.setattr(cl._DOCS_SESSION, "get", fake_get)
+
+    assert cl.validate_docs_url("https://docs.github.com/x", "Copilot code review") is True
+    assert cl.validate_docs_url("https://docs.github.com/x", "Copilot review", strict=True) is True
+    assert calls == ["https://docs.github.com/x"]
 
 
 def test_validate_docs_url_returns_false_on_fetch_error(monkeypatch):
@@ -129,6 +283,46 @@ def test_validate_docs_url_returns_false_on_fetch_error(monkeypatch):
     assert cl.validate_docs_url("https://docs.github.com/x", "anything here") is False
 
 
+def test_validate_docs_url_skips_fetch_without_keywords(monkeypatch):
+    def boom(*a, **k):
+        raise AssertionError("should not fetch")
+    monkeypatch.setattr(cl._DOCS_SESSION, "get", boom)
+    assert cl.validate_docs_url("https://docs.github.com/x", "Now generally available") is False
+
+
+# --- search_github_docs query building --------------------------------------
+
+def test_search_github_docs_drops_stop_words_and_caps_keywords(monkeypatch):
+    seen = {}
+
+    def fake_get(url, *a, **k):
+        seen["url"] = url
+        return _FakeResp('<a href="/en/enterprise-cloud@latest/actions/runners">r</a>')
+    monkeypatch.setattr(cl._DOCS_SESSION, "get", fake_get)
+
+    out = cl.search_github_docs("The new runners are now available for one two three four five six seven")
+    assert out == "https://docs.github.com/en/enterprise-cloud@latest/actions/runners"
+    assert seen["url"].endswith("query=runners%20one%20two%20three%20four%20five")
+
+    # Same capped query from a different entry: served from the memo, no refetch.
+    seen.clear()
+    assert cl.search_github_docs("runners one two three four five, now available") == out
+    assert not seen
+
+
+@pytest.mark.parametrize("text", [
+    "Copilot code review: custom instructions (public preview) for GHEC.",
+    "C# and C++ support; node.js 20 + #hashtags -- dashes",
+    "Dependabot — grouped updates for npm",   # non-ASCII -> regex fallback
+])
+def test_search_tokens_match_regex_tokenizer(text):
+    assert cl._search_tokens(text) == cl._SEARCH_WORD_RE.findall(text.lower())
+
+
+def test_search_github_docs_all_stop_words_returns_none():
+    assert cl.search_github_docs("it is now available for all") is None
+
+
 # --- docs-link ranking (extract_best_docs_url) ------------------------------
 
 def test_best_docs_url_prefers_release_notes_for_version_entry():
@@ -157,6 +351,82 @@ def test_best_docs_url_dedupes_keywords():
     assert best.endswith("/b/two-distinct")
 
 
+def test_embedded_link_naming_the_title_skips_page_validation(monkeypatch, capsys):
+    monkeypatch.delenv("DIGEST_LLM", raising=False)
+    monkeypatch.delenv("DIGEST_LLM_SUMMARIES", raising=False)
+    def boom(*a, **k):
+        raise AssertionError("should not fetch")
+    monkeypatch.setattr(cl._DOCS_SESSION, "get", boom)
+    monkeypatch.setattr(cl, "_docs_url_exists", lambda u: True)
+    url = "https://docs.github.com/en/enterprise-cloud@latest/copilot/using-copilot-code-review"
+    html = f'<a href="{url}">docs</a>'
+    assert cl.search_docs_for_release("Copilot code review is generally available", html) == url
+    assert "Accepted by path (not fetched)" in capsys.readouterr().out
+
+
+def test_embedded_link_naming_the_title_is_rejected_when_dead(monkeypatch):
+    monkeypatch.delenv("DIGEST_LLM", raising=False)
+    monkeypatch.delenv("DIGEST_LLM_SUMMARIES", raising=False)
+    monkeypatch.setattr(cl, "_docs_url_exists", lambda u: False)
+    def not_found(*a, **k):
+        raise cl.requests.HTTPError("404 Not Found")
+    monkeypatch.setattr(cl._DOCS_SESSION, "get", not_found)
+    monkeypatch.setattr(cl, "search_github_docs", lambda *a, **k: None)
+    url = "https://docs.github.com/en/enterprise-cloud@latest/copilot/using-copilot-code-review"
+    html = f'<a href="{url}">docs</a>'
+    assert cl.search_docs_for_release("Copilot code review is generally available", html) is None
+
+
+def test_path_match_scales_with_title_length():
+    url = "https://docs.github.com/en/actions/managing-runners/about-runners"
+    # Two generic product words are not enough for a long, specific title.
+    long_kw = cl._validation_keywords("Actions: Ubuntu 20.04 runner image removed from hosted pools")
+    assert not cl._path_names_title(url, long_kw)
+    assert cl._path_names_title(url, ["actions", "runner"])
+
+
+def test_embedded_link_with_generic_path_is_still_validated(monkeypatch):
+    monkeypatch.delenv("DIGEST_LLM", raising=False)
+    monkeypatch.delenv("DIGEST_LLM_SUMMARIES", raising=False)
+    fetched = []
+
+    def fake_get(url, *a, **k):
+        fetched.append(url)
+        return _FakeResp(_page("copilot", "code", "review"))
+    monkeypatch.setattr(cl._DOCS_SESSION, "get", fake_get)
+    url = "https://docs.github.com/en/enterprise-cloud@latest/get-started/quickstart"
+    html = f'<a href="{url}">docs</a>'
+    assert cl.search_docs_for_release("Copilot code review is generally available", html) == url
+    assert fetched == [url]
+
+
+# --- _clean_html_to_text (boilerplate stripping) ----------------------------
+
+@pytest.mark.parametrize("html,expected", [
+    ("<p>Body text. The post Foo appeared first on The GitHub Blog.</p>", "Body text."),
+    ("<p>Body text. The post Foo appeared first on GitHub Blog.</p>", "Body text."),
+    ("<p>Body text. appeared first on The GitHub Blog.</p>", "Body text."),
+    # "Learn more" is only trailing once the footer after it is gone.
+    ("<p>Body text. Learn more</p><p>The post Foo appeared first on The GitHub Blog.</p>",
+     "Body text."),
+    ("<p>Learn more about it here.</p>", "Learn more about it here."),
+    # Tag-free input skips the parser but still unescapes entities.
+    ("Plain &amp; simple text . The post X appeared first on The GitHub Blog.", "Plain & simple text."),
+])
+def test_clean_html_to_text_strips_boilerplate(html, expected):
+    assert cl._clean_html_to_text(html) == expected
+
+
+def test_clean_html_to_text_leaves_shared_soup_intact():
+    # The parse is shared across extractors, so stripping headings/tables for the
+    # summary must not remove them from the tree the feature extractor reads.
+    html = "<h2>Heading</h2><table><tr><td><ul><li>Cell bullet item text</li></ul></td></tr></table><p>Prose.</p>"
+    assert cl._clean_html_to_text(html) == "Prose."
+    soup = cl._parse_html(html)
+    assert soup.find("h2") is not None
+    assert soup.find("li").get_text() == "Cell bullet item text"
+
+
 # --- optional LLM docs-link picker ------------------------------------------
 
 def test_llm_pick_docs_url_disabled_by_default(monkeypatch):
@@ -291,6 +561,85 @@ def test_shipped_overrides_file_is_well_formed():
         assert value is None or value.startswith("https://docs.github.com/"), value
 
 
+def test_docs_session_retries_never_sleep_on_retry_after():
+    # An uncapped Retry-After sleep could outlast the digest job's time limit.
+    retry = cl._DOCS_SESSION.get_adapter("https://docs.github.com/").max_retries
+    assert retry.respect_retry_after_header is False
+    assert retry.read == 0
+
+
+# --- enrich_entries (concurrent docs resolution) ----------------------------
+
+@pytest.fixture
+def docs_cache(tmp_path, monkeypatch):
+    path = tmp_path / "docs_cache.json"
+    monkeypatch.setattr(cl, "_DOCS_CACHE_FILE", str(path))
+    return path
+
+
+def test_enrich_entries_resolves_docs_per_entry_and_honors_overrides(monkeypatch, docs_cache):
+    monkeypatch.setattr(cl, "_overrides_cache", {"https://x/override": None})
+    monkeypatch.setattr(cl, "search_docs_for_release",
+                        lambda title, *a, **k: f"https://docs.github.com/en/{title}")
+    entries = [_entry(title=f"t{i}") for i in range(5)]
+    for i, e in enumerate(entries):
+        e.url = f"https://x/{i}"
+    entries[2].url = "https://x/override"
+
+    out = cl.enrich_entries(entries)
+    assert out is entries
+    assert [e.docs_url for e in out] == [
+        "https://docs.github.com/en/t0", "https://docs.github.com/en/t1", None,
+        "https://docs.github.com/en/t3", "https://docs.github.com/en/t4",
+    ]
+
+
+def test_enrich_entries_reuses_cached_docs_link_across_runs(monkeypatch, docs_cache):
+    monkeypatch.setattr(cl, "_overrides_cache", {})
+    calls = []
+
+    def fake_search(title, *a, **k):
+        calls.append(title)
+        return None if title == "unresolved" else "https://docs.github.com/en/x"
+    monkeypatch.setattr(cl, "search_docs_for_release", fake_search)
+
+    cl.enrich_entries([_entry(title="resolved"), _entry(title="unresolved")])
+    second = cl.enrich_entries([_entry(title="resolved"), _entry(title="unresolved")])
+    assert second[0].docs_url == "https://docs.github.com/en/x"
+    # The found link is served from cache; the miss is retried, not cached.
+    assert calls == ["resolved", "unresolved", "unresolved"]
+
+
+@pytest.mark.parametrize("content", [
+    '["not", "a", "dict"]',
+    '{"k": "not a record"}',
+    '{"k": {"url": "https://docs.github.com/en/x"}}',   # no timestamp
+])
+def test_enrich_entries_treats_malformed_docs_cache_as_empty(monkeypatch, docs_cache, content):
+    docs_cache.write_text(content)
+    monkeypatch.setattr(cl, "_overrides_cache", {})
+    monkeypatch.setattr(cl, "search_docs_for_release",
+                        lambda *a, **k: "https://docs.github.com/en/y")
+    assert cl.enrich_entries([_entry(title="t")])[0].docs_url == "https://docs.github.com/en/y"
+
+
+def test_enrich_entries_resolves_identical_entries_once(monkeypatch, docs_cache):
+    monkeypatch.setattr(cl, "_overrides_cache", {})
+    calls = []
+    monkeypatch.setattr(cl, "search_docs_for_release",
+                        lambda title, *a, **k: calls.append(title) or None)
+    cl.enrich_entries([_entry(title="Same title"), _entry(title="same  TITLE ")])
+    assert len(calls) == 1
+
+
+def test_docs_cache_drops_expired_records(docs_cache):
+    import json
+    stale = cl.time.time() - (cl.DOCS_CACHE_TTL_DAYS + 1) * 86400
+    docs_cache.write_text(json.dumps({"old": {"url": "u", "ts": stale},
+                                      "new": {"url": "u", "ts": cl.time.time()}}))
+    assert set(cl._load_docs_cache()) == {"new"}
+
+
 # --- entries_to_dict ---------------------------------------------------------
 
 def test_entries_to_dict_shape_and_safe_url():
@@ -320,6 +669,9 @@ def test_entries_to_dict_shape_and_safe_url():
     ("improved performance for large repositories", "Improved performance for large repositories"),
     # Slash commands and code tokens are left as-is.
     ("/settings opens a configuration dialog", "/settings opens a configuration dialog"),
+    # Underscores become spaces in prose but stay literal in code-like bullets.
+    ("Find_symbol jumps to a definition", "Find symbol jumps to a definition"),
+    ("Run pip install my_package to get started", "Run pip install my_package to get started"),
 ])
 def test_normalize_feature_text_capitalization(raw, expected):
     assert cl._normalize_feature_text(raw) == expected
@@ -420,6 +772,31 @@ def test_summary_keeps_sole_titleish_sentence():
     assert "Feature X is now in public preview" in cl.extract_detailed_summary(e)
 
 
+def test_summary_stops_at_char_budget():
+    e = _entry("Release", title="Budget")
+    sentence = "This sentence is exactly sixty characters long, give or take."
+    e.content_html = "<p>" + " ".join([sentence] * 20) + "</p>"
+    s = cl.extract_detailed_summary(e)
+    assert s.count(sentence) == 350 // len(sentence)
+
+
+@pytest.mark.parametrize("sentence,filler", [
+    ("We're excited to announce Copilot code review.", True),
+    ("  Overview:", True),
+    ("What's new?", True),
+    ("Starting today, runners scale to zero.", True),
+    ("What's new in the REST API is pagination.", False),   # anchored, not a heading
+    ("Copilot code review now supports custom instructions.", False),
+])
+def test_is_filler_sentence(sentence, filler):
+    assert cl._is_filler_sentence(sentence) is filler
+
+
+def test_iter_sentences_matches_split():
+    text = "One. Two!  Three? Four"
+    assert list(cl._iter_sentences(text)) == [p.strip() for p in cl._SENTENCE_SPLIT_RE.split(text)]
+
+
 # --- optional LLM summary (opt-in, graceful fallback) -----------------------
 
 def _fake_anthropic(text=None, raises=None):
@@ -42,11 +42,30 @@ def test_build_email_text_plural_and_empty_wording():
     assert "No new updates today." in none
 
 
+# --- HTML body ---------------------------------------------------------------
+
+def test_build_email_html_escapes_and_reuses_compiled_template():
+    releases = [{"title": "<script>x</script>", "url": "https://github.blog/x"}]
+    html = es.build_email_html(releases, [], [], digest_date="Friday, June 12, 2026")
+    assert "&lt;script&gt;" in html and "<script>x" not in html
+    assert es._JINJA_ENV.get_template("digest_email.html") is es._JINJA_ENV.get_template("digest_email.html")
+
+
+def test_build_email_html_lines_fit_8bit_transfer():
+    # Label pills used to render as one >998-byte line, forcing base64.
+    item = {"title": "Copilot code review", "url": "https://github.blog/x",
+            "summary": "A concise summary. " * 18, "labels": ["Copilot", "Code security", "Actions"],
+            "key_features": ["Feature " * 15] * 4, "docs_url": "https://docs.github.com/y"}
+    html = es.build_email_html([item], [item], [item], digest_date="d")
+    assert es._fits_8bit(html)
+
+
 # --- SMTP send semantics -----------------------------------------------------
 
 class _FakeSMTP:
     """Minimal SMTP stand-in; raises for any address containing 'bad'."""
     captured_kwargs = {}
+    extensions = {"8bitmime"}
 
     def __init__(self, *args, **kwargs):
         _FakeSMTP.captured_kwargs = kwargs
@@ -63,7 +82,13 @@ class _FakeSMTP:
     def login(self, *a):
         pass
 
-    def sendmail(self, frm, to, raw):
+    def close(self):
+        pass
+
+    def has_extn(self, name):
+        return name.lower() in self.extensions
+
+    def sendmail(self, frm, to, raw, mail_options=()):
         if "bad" in to:
             raise RuntimeError("550 mailbox unavailable")
 
@@ -90,23 +115,141 @@ def test_send_email_sets_socket_timeout(smtp_env):
     assert _FakeSMTP.captured_kwargs.get("timeout") == 30
 
 
+@pytest.mark.parametrize("first_error,attempts,ok", [
+    (es.smtplib.SMTPServerDisconnected("dropped"), 2, True),       # reconnect once
+    (es.socket.timeout("timed out"), 2, True),
+    (es.smtplib.SMTPAuthenticationError(535, b"bad creds"), 1, False),  # not retried
+])
+def test_send_email_reconnects_once_on_dropped_handshake(smtp_env, monkeypatch,
+                                                         first_error, attempts, ok):
+    calls = []
+
+    def flaky_starttls(self, **k):
+        calls.append(1)
+        if len(calls) == 1:
+            raise first_error
+
+    monkeypatch.setattr(_FakeSMTP, "starttls", flaky_starttls)
+    assert es.send_email(["a@x.com"], "s", "<p>h</p>", "f@x.com") is ok
+    assert len(calls) == attempts
+
+
+def test_send_email_reconnect_log_names_a_bare_exception(smtp_env, monkeypatch, capsys):
+    calls = []
+
+    def flaky_starttls(self, **k):
+        calls.append(1)
+        if len(calls) == 1:
+            raise es.smtplib.SMTPServerDisconnected()
+
+    monkeypatch.setattr(_FakeSMTP, "starttls", flaky_starttls)
+    assert es.send_email(["a@x.com"], "s", "<p>h</p>", "f@x.com") is True
+    assert "SMTP handshake failed (SMTPServerDisconnected)" in capsys.readouterr().out
+
+
 def test_send_email_attaches_text_and_headers(smtp_env):
     captured = {}
     orig = _FakeSMTP.sendmail
 
-    def capture(self, frm, to, raw):
+    def capture(self, frm, to, raw, mail_options=()):
         captured["raw"] = raw
-        return orig(self, frm, to, raw)
+        return orig(self, frm, to, raw, mail_options)
 
     with mock.patch.object(_FakeSMTP, "sendmail", capture):
         es.send_email(["a@x.com"], "Subj", "<p>h</p>", "digest@example.com",
                       text_content="plain body")
 
     import email
-    msg = email.message_from_string(captured["raw"])
+    msg = email.message_from_bytes(captured["raw"])
     assert msg.get_content_type() == "multipart/alternative"
     parts = [p.get_content_type() for p in msg.get_payload()]
     assert parts == ["text/plain", "text/html"]   # least-rich-first ordering
     assert msg["Date"]
     assert msg["Message-ID"]
     assert msg["List-Unsubscribe"] == "<mailto:digest@example.com?subject=unsubscribe>"
+
+
+def test_send_email_shares_encoded_body_across_recipients(smtp_env):
+    raws = []
+    orig = _FakeSMTP.sendmail
+
+    def capture(self, frm, to, raw, mail_options=()):
+        raws.append(raw)
+        return orig(self, frm, to, raw, mail_options)
+
+    with mock.patch.object(_FakeSMTP, "sendmail", capture):
+        es.send_email(["a@x.com", "b@x.com"], "Subj", "<p>h</p>", "digest@example.com",
+                      text_content="plain body")
+
+    import email
+    first, second = (email.message_from_bytes(r) for r in raws)
+    assert (first["To"], second["To"]) == ("a@x.com", "b@x.com")
+    assert first["Message-ID"] != second["Message-ID"]
+    assert ([p.get_payload(decode=True) for p in first.get_payload()]
+            == [p.get_payload(decode=True) for p in second.get_payload()])
+
+
+def test_send_digest_email_reads_the_clock_once(monkeypatch):
+    # Successive now() calls straddle midnight; body and subject must agree.
+    from datetime import datetime as real_dt
+    ticks = iter([real_dt(2026, 6, 12, 23, 59, 59, tzinfo=es.PACIFIC_TZ),
+                  real_dt(2026, 6, 13, 0, 0, 1, tzinfo=es.PACIFIC_TZ)])
+
+    class _Clock:
+        @staticmethod
+        def now(tz=None):
+            return next(ticks)
+
+    sent = {}
+    monkeypatch.setattr(es, "datetime", _Clock)
+    monkeypatch.setattr(es, "send_email",
+                        lambda to, subject, html, **k: sent.update(subject=subject, text=k["text_content"]) or True)
+
+    assert es.send_digest_email([{"title": "a"}], [], [], to_emails=["a@x.com"]) is True
+    assert sent["subject"].endswith("Fri, Jun 12")
+    assert "Friday, June 12, 2026" in sent["text"]
+
+
+@pytest.mark.parametrize("extensions,html,cte,options", [
+    ({"8bitmime"}, "<p>Dependabot — grouped</p>", "8bit", ["BODY=8BITMIME"]),
+    (set(), "<p>Dependabot — grouped</p>", "base64", []),                # server lacks 8BITMIME
+    ({"8bitmime"}, "<p>" + "x" * 1200 + "</p>", "7bit", []),             # line too long for 8bit
+])
+def test_send_email_uses_8bit_body_only_when_safe(smtp_env, monkeypatch, extensions, html, cte, options):
+    monkeypatch.setattr(_FakeSMTP, "extensions", extensions)
+    captured = {}
+
+    def capture(self, frm, to, raw, mail_options=()):
+        captured.update(raw=raw, options=list(mail_options))
+
+    monkeypatch.setattr(_FakeSMTP, "sendmail", capture)
+    es.send_email(["a@x.com"], "Subj", html, "digest@example.com")
+
+    import email
+    part = email.message_from_bytes(captured["raw"]).get_payload()[0]
+    assert part["Content-Transfer-Encoding"] == cte
+    assert part.get_payload(decode=True).decode("utf-8") == html
+    assert captured["options"] == options
+
+
+@pytest.mark.parametrize("extensions,cte", [({"8bitmime"}, "8bit"), (set(), "base64")])
+def test_send_email_wire_bytes_use_crlf_line_endings(smtp_env, monkeypatch, extensions, cte):
+    # smtplib sends bytes verbatim, so the payload itself must be CRLF-terminated.
+    monkeypatch.setattr(_FakeSMTP, "extensions", extensions)
+    captured = {}
+
+    def capture(self, frm, to, raw, mail_options=()):
+        captured.update(raw=raw, options=list(mail_options))
+
+    monkeypatch.setattr(_FakeSMTP, "sendmail", capture)
+    html = "<p>Dependabot — grouped</p>\n<p>second line</p>"
+    es.send_email(["a@x.com"], "Subj", html, "digest@example.com", text_content="plain\nbody —\n")
+
+    raw = captured["raw"]
+    assert b"\n" not in raw.replace(b"\r\n", b"")          # no bare LF
+    assert b"\r" not in raw.replace(b"\r\n", b"")          # no bare CR
+    assert f"Content-Transfer-Encoding: {cte}\r\n".encode() in raw
+    if cte == "8bit":
+        assert captured["options"] == ["BODY=8BITMIME"]
+        assert "<p>Dependabot — grouped</p>\r\n<p>second line</p>".encode() in raw
+        assert all(len(line) <= es._MAX_LINE_BYTES for line in raw.split(b"\r\n"))
@@ -33,16 +33,33 @@ def test_filter_new_entries_all_seen_returns_empty():
     assert state.filter_new_entries(entries, {"a", "b"}) == []
 
 
+def test_filter_new_entries_empty_state_returns_copy():
+    entries = [{"url": "a"}, {"url": "b"}]
+    new = state.filter_new_entries(entries, frozenset())
+    assert new == entries and new is not entries
+
+
 def test_mark_entries_unions_urls():
     result = state.mark_entries_as_processed([{"url": "b"}, {"url": "c"}], {"a"})
     assert result == {"a", "b", "c"}
 
 
+def test_filter_and_mark_accept_a_key_for_entry_objects():
+    from operator import attrgetter
+    from types import SimpleNamespace
+    entries = [SimpleNamespace(url="a"), SimpleNamespace(url="b")]
+    new = state.filter_new_entries(entries, {"a"}, key=attrgetter("url"))
+    assert new == [entries[1]]
+    assert state.mark_entries_as_processed(new, {"a"}, key=attrgetter("url")) == {"a", "b"}
+
+
 # --- save / load round-trip --------------------------------------------------
 
 def test_save_then_load_roundtrip(state_file):
     state.save_processed_urls({"https://x/1", "https://x/2"})
-    assert state.load_processed_urls() == {"https://x/1", "https://x/2"}
+    loaded = state.load_processed_urls()
+    assert loaded == {"https://x/1", "https://x/2"}
+    assert isinstance(loaded, frozenset)
 
 
 def test_load_missing_file_returns_empty(state_file):
@@ -95,3 +112,28 @@ def test_save_prunes_stale_timestamp(state_file):
     saved = json.loads(state_file.read_text())["processed_urls"]
     assert "https://stale" not in saved
     assert "https://fresh" in saved
+
+
+def test_save_reuses_loaded_state_without_rereading(state_file, monkeypatch):
+    existing_ts = (datetime.now() - timedelta(days=10)).isoformat()
+    _write_state(state_file, {"https://x/1": existing_ts})
+    loaded = state.load_processed_state()
+    assert loaded == {"https://x/1": existing_ts}
+
+    def boom():
+        raise AssertionError("state file re-read on save")
+    monkeypatch.setattr(state, "_load_raw_state", boom)
+    state.save_processed_urls(set(loaded) | {"https://x/2"}, existing=loaded)
+    saved = json.loads(state_file.read_text())["processed_urls"]
+    assert saved["https://x/1"] == existing_ts
+    assert "https://x/2" in saved
+
+
+def test_save_orders_newest_first(state_file):
+    now = datetime.now()
+    old = (now - timedelta(days=20)).isoformat()
+    mid = (now - timedelta(days=10)).isoformat()
+    _write_state(state_file, {"https://old": old, "https://mid": mid})
+    state.save_processed_urls({"https://old", "https://mid", "https://new"})
+    saved = json.loads(state_file.read_text())["processed_urls"]
+    assert list(saved) == ["https://new", "https://mid", "https://old"]